@@ -2,33 +2,81 @@
 Advanced example showing various i1Pro features
 """
 
-import sys
-import os
-
-# Add src directory to path for importing xRite package
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import functools
 
 from xRite import I1Pro, MeasurementMode, Observer, Illumination, I1ProException
+from xRite import estimate_cct, planckian_xy, band_powers, spectrum_stats
 import numpy as np
-import matplotlib.pyplot as plt
+
+# Set by --save-only: figures are written to PNG files instead of shown
+SAVE_ONLY = False
+
+
+# Labels of the blue, green and red bands returned by band_powers
+_BAND_LABELS = ("Blue (380-480nm): ", "Green (480-580nm):", "Red (580-730nm):  ")
+
+# Temperatures marked along the blackbody locus
+_MARKER_T = np.array([2000, 3000, 4000, 5000, 6500, 10000], dtype=np.float64)
+
+
+@functools.cache
+def blackbody_locus():
+    """
+    Blackbody locus and its temperature markers, computed on first use
+    
+    Based on the Krystek (1985) approximation for the CIE 1931 2° observer.
+    Deferred so that runs which never plot it skip the planckian_xy kernel.
+    
+    Returns:
+        Tuple of (locus_x, locus_y, marker_x, marker_y) numpy arrays
+    """
+    locus_x, locus_y = planckian_xy(np.linspace(1000, 15000, 100))
+    marker_x, marker_y = planckian_xy(_MARKER_T)
+    return locus_x, locus_y, marker_x, marker_y
+
+
+def import_pyplot():
+    """Import matplotlib.pyplot on first use, so non-plotting examples never load it"""
+    import matplotlib
+    if SAVE_ONLY:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
+    # Simplify and chunk long paths before they reach the Agg renderer
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    plt.rcParams['agg.path.chunksize'] = 10000
+    return plt
+
+
+def show_figure(name):
+    """Show the current figure, or save it as <name>.png in save-only mode"""
+    plt = import_pyplot()
+    if SAVE_ONLY:
+        plt.savefig(f"{name}.png", dpi=100)
+        plt.close()
+        print(f"Saved figure to {name}.png")
+    else:
+        plt.show()
 
 
 def plot_spectrum(wavelengths, spectrum, title="Spectral Power Distribution", ylabel="Relative Power", 
-                  ylim=None, show_100_percent_line=False):
+                  ylim=None, show_100_percent_line=False, name="spectrum"):
     """Plot spectrum data"""
-    plt.figure(figsize=(10, 6))
-    plt.plot(wavelengths, spectrum, 'b-', linewidth=2)
-    plt.xlabel('Wavelength (nm)')
-    plt.ylabel(ylabel)
-    plt.title(title)
-    plt.grid(True, alpha=0.3)
-    plt.xlim(380, 730)
+    plt = import_pyplot()
+    fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
+    ax.plot(wavelengths, spectrum, 'b-', linewidth=2)
+    ax.set_xlabel('Wavelength (nm)')
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.grid(True, alpha=0.3)
+    ax.set_xlim(380, 730)
     if ylim is not None:
-        plt.ylim(ylim)
+        ax.set_ylim(ylim)
     if show_100_percent_line:
-        plt.axhline(y=100, color='r', linestyle='--', alpha=0.3, label='100% Reference')
-        plt.legend()
-    plt.show()
+        ax.axhline(y=100, color='r', linestyle='--', alpha=0.3, label='100% Reference')
+        ax.legend()
+    show_figure(name)
 
 
 def display_measurement_example():
@@ -44,12 +92,12 @@ def display_measurement_example():
         input()
         device.calibrate()
         print("Calibrated!\n")
+        wavelengths = device.get_wavelengths()
         
         print("Place device on display and press Enter to measure...")
         input()
         
         xyY, spectrum = device.measure_xyY_and_spectrum()
-        wavelengths = device.get_wavelengths()
         
         print(f"\nMeasurement Results:")
         print(f"  x = {xyY[0]:.4f}")
@@ -57,16 +105,18 @@ def display_measurement_example():
         print(f"  Y = {xyY[2]:.2f} cd/m²")
         
         # Calculate CCT (simplified)
-        n = (xyY[0] - 0.3320) / (0.1858 - xyY[1])
-        cct = 449 * n**3 + 3525 * n**2 + 6823.3 * n + 5520.33
+        cct = estimate_cct(xyY[0], xyY[1])
         print(f"  CCT ≈ {cct:.0f} K")
         
         # Plot spectrum
-        plot_spectrum(wavelengths, spectrum, f"Display Spectrum (CCT ≈ {cct:.0f}K)")
+        plot_spectrum(wavelengths, spectrum, f"Display Spectrum (CCT ≈ {cct:.0f}K)",
+                      name="display_spectrum")
 
 
 def reflectance_measurement_example():
     """Measure reflectance"""
+    plt = import_pyplot()
+    
     print("=== Reflectance Measurement Example ===\n")
     
     with I1Pro() as device:
@@ -79,12 +129,12 @@ def reflectance_measurement_example():
         input()
         device.calibrate()
         print("Calibrated!\n")
+        wavelengths = device.get_wavelengths()
         
         print("Place device on sample and press Enter to measure...")
         input()
         
         xyY, spectrum = device.measure_xyY_and_spectrum()
-        wavelengths = device.get_wavelengths()
         
         print(wavelengths)
 
@@ -112,17 +162,17 @@ def reflectance_measurement_example():
             print(f"      White tiles are typically 90-95% reflective.")
         
         # Plot spectrum with proper y-axis label
-        plt.figure(figsize=(10, 6))
-        plt.plot(wavelengths, spectrum, 'b-', linewidth=2)
-        plt.xlabel('Wavelength (nm)')
-        plt.ylabel('Reflectance (%)')
-        plt.title(f"Reflectance Spectrum (Y = {xyY[2]:.1f}%)")
-        plt.grid(True, alpha=0.3)
-        plt.xlim(380, 730)
-        plt.ylim(0, 105)  # Set y-axis from 0 to 105%
-        plt.axhline(y=100, color='r', linestyle='--', alpha=0.3, label='100% Reference')
-        plt.legend()
-        plt.show()
+        fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
+        ax.plot(wavelengths, spectrum, 'b-', linewidth=2)
+        ax.set_xlabel('Wavelength (nm)')
+        ax.set_ylabel('Reflectance (%)')
+        ax.set_title(f"Reflectance Spectrum (Y = {xyY[2]:.1f}%)")
+        ax.grid(True, alpha=0.3)
+        ax.set_xlim(380, 730)
+        ax.set_ylim(0, 105)  # Set y-axis from 0 to 105%
+        ax.axhline(y=100, color='r', linestyle='--', alpha=0.3, label='100% Reference')
+        ax.legend()
+        show_figure("reflectance_spectrum")
 
 
 def multiple_measurements_example():
@@ -140,9 +190,7 @@ def multiple_measurements_example():
         print("Calibrated!\n")
         
         num_measurements = 5
-        measurements_Y = []
-        measurements_x = []
-        measurements_y = []
+        xyY_arr = np.empty((num_measurements, 3))
         
         print(f"Taking {num_measurements} measurements...")
         for i in range(num_measurements):
@@ -150,25 +198,28 @@ def multiple_measurements_example():
             input()
             
             xyY, spectrum = device.measure_xyY_and_spectrum()
-            measurements_x.append(xyY[0])
-            measurements_y.append(xyY[1])
-            measurements_Y.append(xyY[2])
+            xyY_arr[i] = xyY
             print(f"  Y = {xyY[2]:.2f} cd/m²")
         
         # Statistics
-        x_array = np.array(measurements_x)
-        y_array = np.array(measurements_y)
-        Y_array = np.array(measurements_Y)
+        means = xyY_arr.mean(axis=0)
+        stds = xyY_arr.std(axis=0)
         
         print(f"\n=== Statistics ===")
-        print(f"x: mean={x_array.mean():.4f}, std={x_array.std():.4f}")
-        print(f"y: mean={y_array.mean():.4f}, std={y_array.std():.4f}")
-        print(f"Y: mean={Y_array.mean():.2f}, std={Y_array.std():.2f} cd/m²")
-        print(f"Y coefficient of variation: {(Y_array.std()/Y_array.mean())*100:.2f}%")
+        print(f"x: mean={means[0]:.4f}, std={stds[0]:.4f}")
+        print(f"y: mean={means[1]:.4f}, std={stds[1]:.4f}")
+        print(f"Y: mean={means[2]:.2f}, std={stds[2]:.2f} cd/m²")
+        print(f"Y coefficient of variation: {(stds[2]/means[2])*100:.2f}%")
+        
+        # CCT of every measurement in one vectorized call
+        ccts = estimate_cct(xyY_arr[:, 0], xyY_arr[:, 1])
+        print(f"CCT: mean={ccts.mean():.0f}K, std={ccts.std():.0f}K")
 
 
 def reflectance_comparison_example():
     """Compare white tile to sample reflectance"""
+    plt = import_pyplot()
+    
     print("=== Reflectance Comparison Example ===\n")
     print("This example shows how to compare different samples")
     print("and understand reflectance values.\n")
@@ -183,12 +234,12 @@ def reflectance_comparison_example():
         input()
         device.calibrate()
         print("Calibrated!\n")
+        wavelengths = device.get_wavelengths()
         
         # Measure white tile
         print("Keep device on white tile and press Enter to measure reference...")
         input()
         white_xyY, white_spectrum = device.measure_xyY_and_spectrum()
-        wavelengths = device.get_wavelengths()
         
         print(f"\nWhite Tile (Reference):")
         print(f"  x = {white_xyY[0]:.4f}, y = {white_xyY[1]:.4f}")
@@ -211,22 +262,24 @@ def reflectance_comparison_example():
         print(f"\nSample reflectance relative to white tile: {relative_reflectance:.1f}%")
         
         # Plot comparison
-        plt.figure(figsize=(12, 6))
-        plt.plot(wavelengths, white_spectrum, 'b-', linewidth=2, label=f'White Tile (Y={white_xyY[2]:.1f}%)')
-        plt.plot(wavelengths, sample_spectrum, 'r-', linewidth=2, label=f'Sample (Y={sample_xyY[2]:.1f}%)')
-        plt.xlabel('Wavelength (nm)')
-        plt.ylabel('Reflectance (%)')
-        plt.title('Spectral Reflectance Comparison')
-        plt.grid(True, alpha=0.3)
-        plt.xlim(380, 730)
-        plt.ylim(0, max(105, np.max(white_spectrum) * 1.1))
-        plt.axhline(y=100, color='gray', linestyle='--', alpha=0.3, label='100% Reference')
-        plt.legend()
-        plt.show()
+        fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+        ax.plot(wavelengths, white_spectrum, 'b-', linewidth=2, label=f'White Tile (Y={white_xyY[2]:.1f}%)')
+        ax.plot(wavelengths, sample_spectrum, 'r-', linewidth=2, label=f'Sample (Y={sample_xyY[2]:.1f}%)')
+        ax.set_xlabel('Wavelength (nm)')
+        ax.set_ylabel('Reflectance (%)')
+        ax.set_title('Spectral Reflectance Comparison')
+        ax.grid(True, alpha=0.3)
+        ax.set_xlim(380, 730)
+        ax.set_ylim(0, max(105, np.max(white_spectrum) * 1.1))
+        ax.axhline(y=100, color='gray', linestyle='--', alpha=0.3, label='100% Reference')
+        ax.legend()
+        show_figure("reflectance_comparison")
 
 
 def ambient_light_measurement_example():
     """Measure ambient light (illuminance)"""
+    plt = import_pyplot()
+    
     print("=== Ambient Light Measurement Example ===\n")
     print("This mode measures ambient lighting conditions.")
     print("Useful for photography, videography, and lighting design.\n")
@@ -242,120 +295,121 @@ def ambient_light_measurement_example():
         input()
         device.calibrate()
         print("Calibrated!\n")
-        
-        print("Point device at light source and press Enter to measure...")
-        input()
-        
-        xyY, spectrum = device.measure_xyY_and_spectrum()
         wavelengths = device.get_wavelengths()
         
-        print(f"\nAmbient Light Results:")
-        print(f"  Illuminance (Y): {xyY[2]:.2f} lux")
-        print(f"  Chromaticity x:  {xyY[0]:.4f}")
-        print(f"  Chromaticity y:  {xyY[1]:.4f}")
-        
-        # Calculate CCT for ambient light
-        n = (xyY[0] - 0.3320) / (0.1858 - xyY[1])
-        cct = 449 * n**3 + 3525 * n**2 + 6823.3 * n + 5520.33
-        print(f"  CCT: ≈{cct:.0f} K")
-        
-        # Classify light level
-        print(f"\nLight Level Classification:")
-        if xyY[2] < 50:
-            classification = "Very dark (moonlight level)"
-        elif xyY[2] < 200:
-            classification = "Dark (dim interior)"
-        elif xyY[2] < 500:
-            classification = "Low light (residential)"
-        elif xyY[2] < 1000:
-            classification = "Medium light (office/commercial)"
-        elif xyY[2] < 2000:
-            classification = "Bright (well-lit workspace)"
-        else:
-            classification = "Very bright (outdoor daylight)"
-        print(f"  {classification}")
-        
-        # Spectral analysis
-        print(f"\nSpectral Distribution:")
-        print(f"  Peak wavelength: {int(wavelengths[np.argmax(spectrum)])} nm")
-        print(f"  Spectrum range: {np.min(spectrum):.2f} - {np.max(spectrum):.2f}")
-        
-        # Dominant wavelength region
-        blue_power = np.mean(spectrum[0:10])   # 380-480nm
-        green_power = np.mean(spectrum[10:20]) # 480-580nm
-        red_power = np.mean(spectrum[20:36])   # 580-730nm
-        total_power = blue_power + green_power + red_power
-        
-        print(f"\nSpectral Power Distribution:")
-        print(f"  Blue (380-480nm):  {(blue_power/total_power)*100:.1f}%")
-        print(f"  Green (480-580nm): {(green_power/total_power)*100:.1f}%")
-        print(f"  Red (580-730nm):   {(red_power/total_power)*100:.1f}%")
+        # Build the figure once; each measurement only updates its artists
+        if not SAVE_ONLY:
+            plt.ion()
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6), constrained_layout=True)
         
-        # Plot spectrum
-        plt.figure(figsize=(12, 6))
-        plt.subplot(1, 2, 1)
-        plt.plot(wavelengths, spectrum, 'b-', linewidth=2)
-        plt.xlabel('Wavelength (nm)')
-        plt.ylabel('Relative Power')
-        plt.title(f'Ambient Light Spectrum\n({xyY[2]:.0f} lux, {cct:.0f}K)')
-        plt.grid(True, alpha=0.3)
-        plt.xlim(380, 730)
+        spectrum_line, = ax1.plot([], [], 'b-', linewidth=2)
+        ax1.set_xlabel('Wavelength (nm)')
+        ax1.set_ylabel('Relative Power')
+        ax1.grid(True, alpha=0.3)
+        ax1.set_xlim(380, 730)
         
         # Plot chromaticity on CIE diagram (simplified)
-        plt.subplot(1, 2, 2)
-        plt.plot(xyY[0], xyY[1], 'ro', markersize=10, label=f'Measured ({cct:.0f}K)')
-        
-        # Plot blackbody locus using correct Planckian formulas
-        # Based on Krystek (1985) approximation for CIE 1931 2° observer
-        cct_range = np.linspace(1000, 15000, 100)
-        x_bb = []
-        y_bb = []
-        for T in cct_range:
-            # Planckian locus approximation by Krystek
-            x_t = (-0.2661239e9/T**3 - 0.2343589e6/T**2 + 0.8776956e3/T + 0.179910)
-            
-            # Calculate y from x based on temperature range
-            if T <= 4000:
-                y_t = -1.1063814*x_t**3 - 1.34811020*x_t**2 + 2.18555832*x_t - 0.20219683
-            else:
-                y_t = -0.9549476*x_t**3 - 1.37418593*x_t**2 + 2.09137015*x_t - 0.16748867
-            
-            x_bb.append(x_t)
-            y_bb.append(y_t)
+        marker_point, = ax2.plot([], [], 'ro', markersize=10)
         
-        plt.plot(x_bb, y_bb, 'k--', linewidth=1.5, alpha=0.7, label='Blackbody locus')
+        # Plot the blackbody locus
+        locus_x, locus_y, marker_x, marker_y = blackbody_locus()
+        ax2.plot(locus_x, locus_y, 'k--', linewidth=1.5, alpha=0.7, label='Blackbody locus')
         
         # Add temperature markers
-        cct_markers = [2000, 3000, 4000, 5000, 6500, 10000]
-        for T in cct_markers:
-            x_t = (-0.2661239e9/T**3 - 0.2343589e6/T**2 + 0.8776956e3/T + 0.179910)
-            if T <= 4000:
-                y_t = -1.1063814*x_t**3 - 1.34811020*x_t**2 + 2.18555832*x_t - 0.20219683
+        ax2.plot(marker_x, marker_y, 'k.', markersize=4)
+        for T, x_t, y_t in zip(_MARKER_T, marker_x, marker_y):
+            ax2.text(x_t+0.01, y_t, f'{int(T)}K', fontsize=8, alpha=0.7)
+        ax2.set_xlabel('x')
+        ax2.set_ylabel('y')
+        ax2.set_title('CIE 1931 Chromaticity')
+        ax2.grid(True, alpha=0.3)
+        ax2.set_xlim(0.2, 0.5)
+        ax2.set_ylim(0.2, 0.5)
+        ax2.axis('equal')
+        
+        measurement_count = 0
+        
+        while True:
+            print("Point device at light source and press Enter to measure...")
+            input()
+            
+            xyY, spectrum = device.measure_xyY_and_spectrum()
+            measurement_count += 1
+            
+            print(f"\nAmbient Light Results:")
+            print(f"  Illuminance (Y): {xyY[2]:.2f} lux")
+            print(f"  Chromaticity x:  {xyY[0]:.4f}")
+            print(f"  Chromaticity y:  {xyY[1]:.4f}")
+            
+            # Calculate CCT for ambient light
+            cct = estimate_cct(xyY[0], xyY[1])
+            print(f"  CCT: ≈{cct:.0f} K")
+            
+            # Classify light level
+            print(f"\nLight Level Classification:")
+            if xyY[2] < 50:
+                classification = "Very dark (moonlight level)"
+            elif xyY[2] < 200:
+                classification = "Dark (dim interior)"
+            elif xyY[2] < 500:
+                classification = "Low light (residential)"
+            elif xyY[2] < 1000:
+                classification = "Medium light (office/commercial)"
+            elif xyY[2] < 2000:
+                classification = "Bright (well-lit workspace)"
             else:
-                y_t = -0.9549476*x_t**3 - 1.37418593*x_t**2 + 2.09137015*x_t - 0.16748867
-            plt.plot(x_t, y_t, 'k.', markersize=4)
-            plt.text(x_t+0.01, y_t, f'{T}K', fontsize=8, alpha=0.7)
-        plt.xlabel('x')
-        plt.ylabel('y')
-        plt.title('CIE 1931 Chromaticity')
-        plt.grid(True, alpha=0.3)
-        plt.xlim(0.2, 0.5)
-        plt.ylim(0.2, 0.5)
-        plt.legend()
-        plt.axis('equal')
-        
-        plt.tight_layout()
-        plt.show()
+                classification = "Very bright (outdoor daylight)"
+            print(f"  {classification}")
+            
+            # Spectral analysis
+            print(f"\nSpectral Distribution:")
+            spec_min, spec_max, peak_idx = spectrum_stats(spectrum)
+            print(f"  Peak wavelength: {int(wavelengths[peak_idx])} nm")
+            print(f"  Spectrum range: {spec_min:.2f} - {spec_max:.2f}")
+            
+            # Dominant wavelength region
+            powers = band_powers(spectrum)
+            percents = powers / powers.sum() * 100.0
+            
+            print(f"\nSpectral Power Distribution:")
+            print("\n".join(f"  {label} {pct:.1f}%" for label, pct in zip(_BAND_LABELS, percents)))
+            
+            # Update the persistent figure with this measurement
+            spectrum_line.set_data(wavelengths, spectrum)
+            ax1.relim()
+            ax1.autoscale_view(scalex=False)
+            ax1.set_title(f'Ambient Light Spectrum\n({xyY[2]:.0f} lux, {cct:.0f}K)')
+            
+            marker_point.set_data([xyY[0]], [xyY[1]])
+            marker_point.set_label(f'Measured ({cct:.0f}K)')
+            ax2.legend()
+            
+            if SAVE_ONLY:
+                fig.savefig(f"ambient_light_{measurement_count}.png", dpi=100)
+                print(f"Saved figure to ambient_light_{measurement_count}.png")
+            else:
+                fig.canvas.draw_idle()
+                fig.canvas.flush_events()
+                plt.pause(0.001)
+            
+            # Option for multiple measurements
+            print("\n" + "=" * 60)
+            response = input("Take another measurement? (y/n): ")
+            if response.lower() != 'y':
+                break
         
-        # Option for multiple measurements
-        print("\n" + "=" * 60)
-        response = input("Take another measurement? (y/n): ")
-        if response.lower() == 'y':
-            ambient_light_measurement_example()
+        # Keep the final measurement on screen until the user closes it
+        if not SAVE_ONLY:
+            plt.ioff()
+            plt.show()
+        plt.close(fig)
 
 
 def scan_mode_example():
     """Example of using scan mode"""
+    plt = import_pyplot()
+    from matplotlib.collections import LineCollection
+    
     print("=== Scan Mode Example ===\n")
     
     with I1Pro() as device:
@@ -368,6 +422,7 @@ def scan_mode_example():
         input("Press Enter...")
         device.calibrate()
         print("Calibrated!\n")
+        wavelengths = device.get_wavelengths()
         
         print("Press button on device and scan across patch strip...")
         device.wait_for_button()
@@ -379,32 +434,51 @@ def scan_mode_example():
         num_samples = device.get_number_of_samples()
         print(f"\nScanned {num_samples} patches")
         
-        # Collect all measurements
-        spectra = []
-        xyY_values = []
+        # Collect all measurements, one contiguous array per quantity
+        x_values = np.empty(num_samples, dtype=np.float64)
+        y_values = np.empty(num_samples, dtype=np.float64)
+        Y_values = np.empty(num_samples, dtype=np.float64)
+        spectra = device.get_all_spectra()
         
         for i in range(num_samples):
-            xyY = device.get_xyY(i)
-            spectrum = device.get_spectrum(i)
-            xyY_values.append(xyY)
-            spectra.append(spectrum)
-            print(f"Patch {i+1}: Y={xyY[2]:.2f}%")
-        
-        # Plot all spectra
-        wavelengths = device.get_wavelengths()
-        plt.figure(figsize=(12, 6))
-        for i, spectrum in enumerate(spectra):
-            plt.plot(wavelengths, spectrum, label=f"Patch {i+1}")
-        plt.xlabel('Wavelength (nm)')
-        plt.ylabel('Reflectance (%)')
-        plt.title(f'Scan Results: {num_samples} Patches')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.show()
+            x_values[i], y_values[i], Y_values[i] = device.get_xyY(i)
+        
+        print("\n".join(f"Patch {i+1}: x={x:.4f}, y={y:.4f}, Y={Y:.2f}%"
+                        for i, (x, y, Y) in enumerate(zip(x_values, y_values, Y_values))))
+        
+        # Plot all spectra as a single collection, colored by patch index
+        segments = np.stack([np.broadcast_to(wavelengths, spectra.shape), spectra], axis=-1)
+        lc = LineCollection(segments, linewidths=1, cmap='viridis')
+        lc.set_array(np.arange(1, num_samples + 1))
+        
+        fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
+        ax.add_collection(lc)
+        ax.set_xlim(380, 730)
+        if num_samples:
+            ax.set_ylim(spectra.min(), spectra.max())
+        ax.set_xlabel('Wavelength (nm)')
+        ax.set_ylabel('Reflectance (%)')
+        ax.set_title(f'Scan Results: {num_samples} Patches')
+        fig.colorbar(lc, ax=ax, label='Patch')
+        ax.grid(True, alpha=0.3)
+        show_figure("scan_results")
 
 
 def main():
     """Main menu"""
+    import argparse
+    
+    global SAVE_ONLY
+    
+    parser = argparse.ArgumentParser(description='i1Pro Python Wrapper - Advanced Examples')
+    parser.add_argument('--save-only', action='store_true',
+                       help='Render figures with the Agg backend and save them as PNG instead of showing them')
+    
+    args = parser.parse_args()
+    
+    if args.save_only:
+        SAVE_ONLY = True
+    
     print("i1Pro Python Wrapper - Advanced Examples")
     print("=" * 50)
     print("\nSelect example:")
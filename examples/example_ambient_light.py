@@ -4,64 +4,80 @@ Useful for measuring room lighting, photography lighting, etc.
 """
 
 import sys
-import os
-
-# Add src directory to path for importing xRite package
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import io
 
 from xRite import I1Pro, MeasurementMode, Observer, Illumination, I1ProException
+from xRite import estimate_cct, band_powers, spectrum_stats
 import numpy as np
 
 
+# Labels of the blue, green and red bands returned by band_powers
+_BAND_LABELS = ("Blue: ", "Green:", "Red:  ")
+_BAND_RANGES = ("380-480nm", "480-580nm", "580-730nm")
+
+# Illuminance classes: upper bounds (lux) and the matching labels
+_LUX_THRESHOLDS = np.array([1, 10, 50, 100, 300, 500, 1000, 2500, 10000, 50000])
+_LUX_LEVEL = (
+    "Darkness", "Very dark", "Dark", "Low light", "Medium-low", "Medium",
+    "Bright", "Very bright", "Extremely bright", "Outdoor shade", "Direct sunlight",
+)
+_LUX_DESC = (
+    "Moonless night",
+    "Moonlight, dimmed lights",
+    "Typical home lighting (evening)",
+    "Hallways, corridors",
+    "Living room, bedroom",
+    "Office lighting (recommended minimum)",
+    "Office, retail (good lighting)",
+    "Supermarket, well-lit workspace",
+    "Operating room, studio lighting",
+    "Cloudy day outdoors",
+    "Full daylight",
+)
+
+# Color temperature classes: upper bounds (K) and the matching labels
+_CCT_THRESHOLDS = np.array([2000, 2700, 3500, 4500, 6000, 7000])
+_CCT_LABELS = (
+    "Candle flame",
+    "Warm white (incandescent)",
+    "Warm white (halogen)",
+    "Neutral white",
+    "Cool white",
+    "Daylight",
+    "Cool daylight / Overcast sky",
+)
+
+# Fixed part of the per-measurement report
+_REPORT_TEMPLATE = """
+{rule}
+MEASUREMENT #{count}
+{rule}
+
+📊 Illuminance:
+   {lux:,.1f} lux
+   Level: {level}
+   ({description})
+
+🌡️  Color Temperature:
+   {cct:.0f} K
+   Type: {cct_type}
+
+🎨 Chromaticity:
+   x = {x:.4f}
+   y = {y:.4f}
+""".replace("{rule}", "-" * 70)
+
+
 def classify_light_level(lux):
     """Classify illuminance level"""
-    if lux < 1:
-        return "Darkness", "Moonless night"
-    elif lux < 10:
-        return "Very dark", "Moonlight, dimmed lights"
-    elif lux < 50:
-        return "Dark", "Typical home lighting (evening)"
-    elif lux < 100:
-        return "Low light", "Hallways, corridors"
-    elif lux < 300:
-        return "Medium-low", "Living room, bedroom"
-    elif lux < 500:
-        return "Medium", "Office lighting (recommended minimum)"
-    elif lux < 1000:
-        return "Bright", "Office, retail (good lighting)"
-    elif lux < 2500:
-        return "Very bright", "Supermarket, well-lit workspace"
-    elif lux < 10000:
-        return "Extremely bright", "Operating room, studio lighting"
-    elif lux < 50000:
-        return "Outdoor shade", "Cloudy day outdoors"
-    else:
-        return "Direct sunlight", "Full daylight"
-
-
-def estimate_cct(x, y):
-    """Estimate Correlated Color Temperature"""
-    n = (x - 0.3320) / (0.1858 - y)
-    cct = 449 * n**3 + 3525 * n**2 + 6823.3 * n + 5520.33
-    return cct
+    idx = int(np.searchsorted(_LUX_THRESHOLDS, lux, side='right'))
+    return _LUX_LEVEL[idx], _LUX_DESC[idx]
 
 
 def classify_color_temperature(cct):
     """Classify color temperature"""
-    if cct < 2000:
-        return "Candle flame"
-    elif cct < 2700:
-        return "Warm white (incandescent)"
-    elif cct < 3500:
-        return "Warm white (halogen)"
-    elif cct < 4500:
-        return "Neutral white"
-    elif cct < 6000:
-        return "Cool white"
-    elif cct < 7000:
-        return "Daylight"
-    else:
-        return "Cool daylight / Overcast sky"
+    idx = int(np.searchsorted(_CCT_THRESHOLDS, cct, side='right'))
+    return _CCT_LABELS[idx]
 
 
 def main():
@@ -96,6 +112,7 @@ def main():
             
             device.calibrate()
             print("✓ Calibrated successfully!")
+            wavelengths = device.get_wavelengths()
             
             # Measurement loop
             print("\n" + "=" * 70)
@@ -112,92 +129,83 @@ def main():
                 
                 measurement_count += 1
                 xyY, spectrum = device.measure_xyY_and_spectrum()
-                wavelengths = device.get_wavelengths()
                 
                 # Display results
-                print("\n" + "-" * 70)
-                print(f"MEASUREMENT #{measurement_count}")
-                print("-" * 70)
-                
-                # Basic measurements
-                print(f"\n📊 Illuminance:")
-                print(f"   {xyY[2]:,.1f} lux")
                 level, description = classify_light_level(xyY[2])
-                print(f"   Level: {level}")
-                print(f"   ({description})")
-                
-                # Color temperature
                 cct = estimate_cct(xyY[0], xyY[1])
-                print(f"\n🌡️  Color Temperature:")
-                print(f"   {cct:.0f} K")
-                print(f"   Type: {classify_color_temperature(cct)}")
-                
-                # Chromaticity
-                print(f"\n🎨 Chromaticity:")
-                print(f"   x = {xyY[0]:.4f}")
-                print(f"   y = {xyY[1]:.4f}")
+                report = io.StringIO()
+                report.write(_REPORT_TEMPLATE.format_map({
+                    'count': measurement_count,
+                    'x': xyY[0],
+                    'y': xyY[1],
+                    'lux': xyY[2],
+                    'level': level,
+                    'description': description,
+                    'cct': cct,
+                    'cct_type': classify_color_temperature(cct),
+                }))
                 
                 # Spectral analysis
-                blue_power = np.mean(spectrum[0:10])   # 380-480nm
-                green_power = np.mean(spectrum[10:20]) # 480-580nm  
-                red_power = np.mean(spectrum[20:36])   # 580-730nm
-                total_power = blue_power + green_power + red_power
+                powers = band_powers(spectrum)
+                percents = powers / powers.sum() * 100.0
+                blue_pct, green_pct, red_pct = percents
                 
-                print(f"\n🌈 Spectral Composition:")
-                print(f"   Blue:  {(blue_power/total_power)*100:5.1f}% (380-480nm)")
-                print(f"   Green: {(green_power/total_power)*100:5.1f}% (480-580nm)")
-                print(f"   Red:   {(red_power/total_power)*100:5.1f}% (580-730nm)")
+                print(f"\n🌈 Spectral Composition:", file=report)
+                print("\n".join(f"   {label} {pct:5.1f}% ({band})"
+                                for label, band, pct in zip(_BAND_LABELS, _BAND_RANGES, percents)),
+                      file=report)
                 
-                peak_wl = int(wavelengths[np.argmax(spectrum)])
-                print(f"   Peak wavelength: {peak_wl} nm")
+                _, _, peak_idx = spectrum_stats(spectrum)
+                peak_wl = int(wavelengths[peak_idx])
+                print(f"   Peak wavelength: {peak_wl} nm", file=report)
                 
                 # Light quality assessment
-                print(f"\n💡 Light Quality Notes:")
+                print(f"\n💡 Light Quality Notes:", file=report)
                 
                 # Check for balanced spectrum (good for color rendering)
-                if 30 < (blue_power/total_power)*100 < 40 and \
-                   30 < (green_power/total_power)*100 < 40 and \
-                   25 < (red_power/total_power)*100 < 35:
-                    print(f"   ✓ Well-balanced spectrum (good color rendering)")
+                if 30 < blue_pct < 40 and 30 < green_pct < 40 and 25 < red_pct < 35:
+                    print(f"   ✓ Well-balanced spectrum (good color rendering)", file=report)
                 else:
-                    print(f"   ⚠ Unbalanced spectrum")
+                    print(f"   ⚠ Unbalanced spectrum", file=report)
                 
                 # Warm vs cool
                 if cct < 3000:
-                    print(f"   🔥 Warm light (relaxing, cozy)")
+                    print(f"   🔥 Warm light (relaxing, cozy)", file=report)
                 elif cct > 5000:
-                    print(f"   ❄️  Cool light (alerting, energizing)")
+                    print(f"   ❄️  Cool light (alerting, energizing)", file=report)
                 else:
-                    print(f"   ⚪ Neutral light (versatile)")
+                    print(f"   ⚪ Neutral light (versatile)", file=report)
                 
                 # Brightness assessment for different activities
-                print(f"\n📖 Lighting Recommendations:")
+                print(f"\n📖 Lighting Recommendations:", file=report)
                 if xyY[2] < 200:
-                    print(f"   Too dark for most tasks")
-                    print(f"   Good for: Ambient/mood lighting, watching TV")
+                    print(f"   Too dark for most tasks", file=report)
+                    print(f"   Good for: Ambient/mood lighting, watching TV", file=report)
                 elif xyY[2] < 500:
-                    print(f"   Adequate for: Reading, casual work")
-                    print(f"   Too dim for: Detailed work, precise tasks")
+                    print(f"   Adequate for: Reading, casual work", file=report)
+                    print(f"   Too dim for: Detailed work, precise tasks", file=report)
                 elif xyY[2] < 1000:
-                    print(f"   Good for: Office work, general tasks")
-                    print(f"   Adequate for: Reading, computer work")
+                    print(f"   Good for: Office work, general tasks", file=report)
+                    print(f"   Adequate for: Reading, computer work", file=report)
                 elif xyY[2] < 2000:
-                    print(f"   Excellent for: Detailed work, art, precision tasks")
+                    print(f"   Excellent for: Detailed work, art, precision tasks", file=report)
                 else:
-                    print(f"   Very bright - excellent for: All tasks")
+                    print(f"   Very bright - excellent for: All tasks", file=report)
                 
                 # Comparison to standards
-                print(f"\n📏 Standards Comparison:")
+                print(f"\n📏 Standards Comparison:", file=report)
                 if xyY[2] < 300:
-                    print(f"   ⚠ Below ISO 8995 office minimum (500 lux)")
+                    print(f"   ⚠ Below ISO 8995 office minimum (500 lux)", file=report)
                 elif xyY[2] < 500:
-                    print(f"   ⚠ At lower limit for office work")
+                    print(f"   ⚠ At lower limit for office work", file=report)
                 elif xyY[2] < 750:
-                    print(f"   ✓ Good for general office work")
+                    print(f"   ✓ Good for general office work", file=report)
                 else:
-                    print(f"   ✓ Exceeds office requirements")
+                    print(f"   ✓ Exceeds office requirements", file=report)
                 
-                print("\n" + "-" * 70)
+                print("\n" + "-" * 70, file=report)
+                sys.stdout.write(report.getvalue())
+                sys.stdout.flush()
     
     except KeyboardInterrupt:
         print("\n\nMeasurement stopped by user.")
@@ -3,18 +3,23 @@ Simple example of using the i1Pro Python wrapper
 Mirrors the functionality of eyeone.cpp example
 """
 
-import sys
-import os
-
-# Add src directory to path for importing xRite package
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from xRite import I1Pro, MeasurementMode, Observer, I1ProException
 import numpy as np
 
 
 def main():
     """Simple measurement loop"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Simple i1Pro measurement loop')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Print the full spectrum after each measurement')
+    
+    args = parser.parse_args()
+    
+    # Compact spectrum output when --verbose is used
+    np.set_printoptions(precision=3, suppress=True, linewidth=200)
+    
     try:
         # Create and initialize device
         device = I1Pro()
@@ -45,7 +50,8 @@ def main():
             
             # Display results
             print(f"\nxyY: x={xyY[0]:.4f}, y={xyY[1]:.4f}, Y={xyY[2]:.2f} cd/m²")
-            print(f"Spectrum: {spectrum}")
+            if args.verbose:
+                print(f"Spectrum: {spectrum}")
             print("\nPress Enter to measure again...")
     
     except KeyboardInterrupt:
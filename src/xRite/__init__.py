@@ -4,8 +4,11 @@ xRite Python SDK Wrapper Package
 This package provides Python wrappers for:
 - i1Pro SDK for colorimetric measurements
 - ColorChecker detection and color extraction using ArUco markers
+- Colorimetry helpers (CCT, Planckian locus, spectral bands)
 """
 
+import importlib
+
 from xRite.i1pro_wrapper import (
     I1Pro,
     I1ProSDK,
@@ -20,22 +23,48 @@ from xRite.i1pro_wrapper import (
     SPECTRUM_SIZE,
     TRISTIMULUS_SIZE,
     DENSITY_SIZE,
+    WAVELENGTHS,
 )
 
-from xRite.colorchecker_detector import (
-    ColorCheckerDetector,
-    COLORCHECKER_LAYOUTS,
-    load_camera_params,
-)
+# The ColorChecker modules pull in OpenCV and ReportLab, and color_utils may
+# compile Numba kernels; they are imported on first attribute access so that
+# i1Pro-only code (and enum-only tests) does not pay for them. The i1Pro DLL
+# itself is only loaded when an I1Pro is constructed.
+_LAZY_IMPORTS = {
+    # ColorChecker detector
+    "ColorCheckerDetector": "xRite.colorchecker_detector",
+    "COLORCHECKER_LAYOUTS": "xRite.colorchecker_detector",
+    "load_camera_params": "xRite.colorchecker_detector",
+    # ColorChecker template
+    "create_pdf_template": "xRite.colorchecker_template",
+    "generate_aruco_marker": "xRite.colorchecker_template",
+    "draw_aruco_marker": "xRite.colorchecker_template",
+    "COLORCHECKER_SPECS": "xRite.colorchecker_template",
+    "ARUCO_DICT": "xRite.colorchecker_template",
+    "MARKER_SIZE_MM": "xRite.colorchecker_template",
+    "MARKER_IDS": "xRite.colorchecker_template",
+    # Color utilities
+    "estimate_cct": "xRite.color_utils",
+    "planckian_xy": "xRite.color_utils",
+    "band_powers": "xRite.color_utils",
+    "spectrum_stats": "xRite.color_utils",
+    "spectrum_summary": "xRite.color_utils",
+    "relative_reflectance": "xRite.color_utils",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-from xRite.colorchecker_template import (
-    create_pdf_template,
-    generate_aruco_marker,
-    COLORCHECKER_SPECS,
-    ARUCO_DICT,
-    MARKER_SIZE_MM,
-    MARKER_IDS,
-)
 
 __version__ = "1.0.0"
 __all__ = [
@@ -53,6 +82,7 @@ __all__ = [
     "SPECTRUM_SIZE",
     "TRISTIMULUS_SIZE",
     "DENSITY_SIZE",
+    "WAVELENGTHS",
     # ColorChecker detector
     "ColorCheckerDetector",
     "COLORCHECKER_LAYOUTS",
@@ -60,8 +90,16 @@ __all__ = [
     # ColorChecker template
     "create_pdf_template",
     "generate_aruco_marker",
+    "draw_aruco_marker",
     "COLORCHECKER_SPECS",
     "ARUCO_DICT",
     "MARKER_SIZE_MM",
     "MARKER_IDS",
+    # Color utilities
+    "estimate_cct",
+    "planckian_xy",
+    "band_powers",
+    "spectrum_stats",
+    "spectrum_summary",
+    "relative_reflectance",
 ]
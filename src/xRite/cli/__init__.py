@@ -0,0 +1,7 @@
+"""
+Command line entry points for the xRite package
+
+The console scripts are registered in pyproject.toml:
+- xrite-detect: ColorChecker detection (xRite.cli.detect)
+- xrite-template: ColorChecker template generation (xRite.cli.template)
+"""
@@ -0,0 +1,55 @@
+"""
+ColorChecker detection command line tool (xrite-detect)
+
+Detects a ColorChecker in an image using ArUco markers and extracts patch colors.
+"""
+
+import argparse
+import logging
+
+from xRite import ColorCheckerDetector, load_camera_params
+
+
+_PARSER = argparse.ArgumentParser(
+    description='Detect ColorChecker and extract patch colors using ArUco markers')
+_PARSER.add_argument('--input', '-i', required=True,
+                     help='Input image path (8-bit or 16-bit RGB)')
+_PARSER.add_argument('--output', '-o', required=True,
+                     help='Output directory for results')
+_PARSER.add_argument('--camera-params', '-c',
+                     help='Optional: Camera intrinsic parameters (JSON file)')
+_PARSER.add_argument('--light-compensation', '-l', action='store_true',
+                     help='Apply light compensation (Digital SG only)')
+
+
+def main():
+    args = _PARSER.parse_args()
+    
+    # Show the detector's progress messages
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
+    # Load camera parameters if provided
+    camera_params = None
+    if args.camera_params:
+        try:
+            camera_params = load_camera_params(args.camera_params)
+            print("Loaded camera parameters")
+        except Exception as e:
+            print(f"Warning: Could not load camera parameters: {e}")
+    
+    # Create detector
+    detector = ColorCheckerDetector(camera_params)
+    
+    # Process image
+    result = detector.process_image(args.input, args.output, args.light_compensation)
+    
+    if 'error' in result:
+        print(f"Error: {result['error']}")
+        return 1
+    
+    print("\nProcessing complete!")
+    print(f"ColorChecker type: {result['colorchecker_type']}")
+    print(f"Total patches: {result['total_patches']}")
+    print(f"Output files saved to: {args.output}")
+    
+    return 0
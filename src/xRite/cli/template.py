@@ -0,0 +1,32 @@
+"""
+ColorChecker template generation command line tool (xrite-template)
+
+Generates a PDF template with ArUco markers for ColorChecker detection.
+"""
+
+import argparse
+
+from xRite import create_pdf_template, COLORCHECKER_SPECS
+
+
+# Display name of each ColorChecker type
+_TYPE_NAMES = {key: spec['name'] for key, spec in COLORCHECKER_SPECS.items()}
+
+_PARSER = argparse.ArgumentParser(
+    description='Generate ColorChecker detection template with ArUco markers')
+_PARSER.add_argument('--type', '-t',
+                     choices=['classic', 'digitalsg'],
+                     default='classic',
+                     help='Type of ColorChecker (classic or digitalsg)')
+_PARSER.add_argument('--output', '-o',
+                     default='colorchecker_template.pdf',
+                     help='Output PDF file path')
+
+
+def main():
+    args = _PARSER.parse_args()
+    
+    print(f"Generating template for {_TYPE_NAMES[args.type]}...")
+    create_pdf_template(args.type, args.output)
+    print(f"Template saved to: {args.output}")
+
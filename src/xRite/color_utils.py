@@ -0,0 +1,160 @@
+"""
+Colorimetry helpers shared by the i1Pro examples
+
+This module provides correlated color temperature estimation, the Planckian
+(blackbody) locus and spectral band powers. When Numba is installed the numeric
+kernels are compiled to machine code and cached on disk; otherwise they run as
+plain NumPy code.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback when Numba is not installed: return the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def estimate_cct(x, y):
+    """
+    Estimate the Correlated Color Temperature from CIE 1931 chromaticity
+
+    Uses McCamy's cubic approximation, evaluated in Horner form.
+    Accepts scalars or arrays of equal shape.
+
+    Args:
+        x: Chromaticity x
+        y: Chromaticity y
+
+    Returns:
+        CCT in Kelvin (scalar or numpy array)
+    """
+    n = (x - 0.3320) / (0.1858 - y)
+    return ((449.0*n + 3525.0)*n + 6823.3)*n + 5520.33
+
+
+@njit(cache=True)
+def _planckian_xy(cct):
+    x_bb = ((-0.2661239e9/cct - 0.2343589e6)/cct + 0.8776956e3)/cct + 0.179910
+    # Krystek (1985) y(x) polynomials for T <= 4000K and T > 4000K
+    y_lo = ((-1.1063814*x_bb - 1.34811020)*x_bb + 2.18555832)*x_bb - 0.20219683
+    y_hi = ((-0.9549476*x_bb - 1.37418593)*x_bb + 2.09137015)*x_bb - 0.16748867
+    y_bb = np.where(cct <= 4000.0, y_lo, y_hi)
+    return x_bb, y_bb
+
+
+def planckian_xy(cct):
+    """
+    Chromaticity of the blackbody locus for an array of temperatures
+
+    Based on the Krystek (1985) approximation for the CIE 1931 2° observer.
+
+    Args:
+        cct: Temperatures in Kelvin (array-like)
+
+    Returns:
+        Tuple of (x, y) numpy arrays
+    """
+    return _planckian_xy(np.ascontiguousarray(cct, dtype=np.float64))
+
+
+@njit(cache=True, fastmath=True)
+def band_powers(spectrum):
+    """
+    Mean spectral power of the blue, green and red bands
+
+    Args:
+        spectrum: 36-sample spectrum from 380nm to 730nm in 10nm steps
+
+    Returns:
+        numpy array of [blue (380-480nm), green (480-580nm), red (580-730nm)]
+    """
+    powers = np.empty(3, dtype=np.float64)
+    powers[0] = spectrum[0:10].sum() / 10.0
+    powers[1] = spectrum[10:20].sum() / 10.0
+    powers[2] = spectrum[20:36].sum() / 16.0
+    return powers
+
+
+@njit(cache=True)
+def spectrum_stats(spectrum):
+    """
+    Minimum, maximum and index of the maximum of a spectrum in a single pass
+
+    Args:
+        spectrum: 1-D spectrum array (at least one sample)
+
+    Returns:
+        Tuple of (min, max, argmax)
+    """
+    mn = spectrum[0]
+    mx = spectrum[0]
+    amx = 0
+    for i in range(1, spectrum.size):
+        v = spectrum[i]
+        if v < mn:
+            mn = v
+        elif v > mx:
+            mx = v
+            amx = i
+    return mn, mx, amx
+
+
+@njit(cache=True)
+def spectrum_summary(spectrum):
+    """
+    Minimum, maximum, mean and standard deviation of a spectrum in a single pass
+
+    The mean and variance use Welford's update in float64, which stays accurate
+    for nearly flat spectra such as a white tile.
+
+    Args:
+        spectrum: 1-D spectrum array (at least one sample)
+
+    Returns:
+        Tuple of (min, max, mean, std), with std the population standard deviation
+    """
+    mn = float(spectrum[0])
+    mx = mn
+    mean = 0.0
+    m2 = 0.0
+    for i in range(spectrum.size):
+        v = float(spectrum[i])
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+        delta = v - mean
+        mean += delta / (i + 1)
+        m2 += delta * (v - mean)
+    return mn, mx, mean, np.sqrt(m2 / spectrum.size)
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def relative_reflectance(samples, reference):
+    """
+    Spectra relative to a reference spectrum (e.g. the white tile), in percent
+
+    Samples are processed in parallel when Numba is installed.
+
+    Args:
+        samples: (N, S) array of sample spectra
+        reference: (S,) reference spectrum
+
+    Returns:
+        (N, S) float64 array; wavelengths where the reference is not positive are 0
+    """
+    n, m = samples.shape
+    out = np.empty((n, m), dtype=np.float64)
+    for i in prange(n):
+        for j in range(m):
+            r = reference[j]
+            out[i, j] = samples[i, j] / r * 100.0 if r > 0.0 else 0.0
+    return out
@@ -8,9 +8,15 @@ extracts the color values from each patch, and optionally performs light compens
 import cv2
 import numpy as np
 import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+logger = logging.getLogger(__name__)
+
 
 # ColorChecker specifications
 COLORCHECKER_LAYOUTS = {
@@ -43,6 +49,35 @@ COLORCHECKER_LAYOUTS = {
 ARUCO_DICT = cv2.aruco.DICT_4X4_100
 MARKER_IDS = [0, 1, 2, 3]  # Top-Left, Top-Right, Bottom-Right, Bottom-Left
 
+# Dictionary, parameters and detector are built once and shared by all detectors
+_ARUCO_DICTIONARY = cv2.aruco.getPredefinedDictionary(ARUCO_DICT)
+_DETECTOR_PARAMS = cv2.aruco.DetectorParameters()
+_ARUCO_DETECTOR = cv2.aruco.ArucoDetector(_ARUCO_DICTIONARY, _DETECTOR_PARAMS)
+
+# Required marker IDs as a column, for matching against detected IDs in one comparison
+_MARKER_ID_COLUMN = np.array(MARKER_IDS)[:, None]
+
+
+def _window_indices(starts: np.ndarray, stops: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenate the index ranges [starts[i], stops[i]).
+    
+    Returns:
+        Tuple of (concatenated indices, offset of each range in the result)
+    """
+    widths = stops - starts
+    offsets = np.cumsum(widths) - widths
+    indices = np.arange(widths.sum()) + np.repeat(starts - offsets, widths)
+    return indices, offsets
+
+
+def _write_png(path: Path, image: np.ndarray, compress_level: int) -> None:
+    """Encode an image as PNG in memory and write the bytes in one call."""
+    ok, buf = cv2.imencode('.png', image, [cv2.IMWRITE_PNG_COMPRESSION, compress_level])
+    if not ok:
+        raise IOError(f"Could not encode PNG image: {path}")
+    Path(path).write_bytes(buf)
+
 
 class ColorCheckerDetector:
     """Detects and extracts colors from ColorChecker charts using ArUco markers."""
@@ -55,61 +90,68 @@ class ColorCheckerDetector:
             camera_params: Optional dictionary with 'camera_matrix' and 'dist_coeffs'
         """
         self.camera_params = camera_params
-        self.aruco_dict = cv2.aruco.getPredefinedDictionary(ARUCO_DICT)
-        self.aruco_params = cv2.aruco.DetectorParameters()
-        self.detector = cv2.aruco.ArucoDetector(self.aruco_dict, self.aruco_params)
+        self.aruco_dict = _ARUCO_DICTIONARY
+        self.aruco_params = _DETECTOR_PARAMS
+        self.detector = _ARUCO_DETECTOR
+        self._gray_buf = None  # Reused grayscale buffer for detect_markers
         
     def detect_markers(self, image: np.ndarray) -> Tuple[Optional[np.ndarray], Dict]:
         """
         Detect ArUco markers in the image.
         
+        Callers processing a stream of frames can pass grayscale frames directly
+        to skip the color conversion.
+        
         Args:
-            image: Input image
+            image: Input image (BGR or single-channel)
             
         Returns:
-            Tuple of (corners array, info dict)
+            Tuple of (corners array, info dict). The corners array has shape (4, 4, 2)
+            and holds the corners of markers MARKER_IDS, in that order.
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        if len(image.shape) == 3:
+            # Convert into a buffer reused across calls with the same frame size
+            gray_shape = image.shape[:2]
+            if (self._gray_buf is None or self._gray_buf.shape != gray_shape
+                    or self._gray_buf.dtype != image.dtype):
+                self._gray_buf = np.empty(gray_shape, dtype=image.dtype)
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+        else:
+            gray = image
         
         corners, ids, rejected = self.detector.detectMarkers(gray)
         
         if ids is None or len(ids) < 4:
             return None, {'error': f'Only {len(ids) if ids is not None else 0} markers detected, need 4'}
         
-        # Check if we have all required marker IDs
+        # Match every required ID against the detections (last detection wins)
         detected_ids = ids.flatten()
-        missing_ids = [mid for mid in MARKER_IDS if mid not in detected_ids]
+        matches = detected_ids[::-1] == _MARKER_ID_COLUMN
+        found = matches.any(axis=1)
         
-        if missing_ids:
+        if not found.all():
+            missing_ids = [mid for mid, ok in zip(MARKER_IDS, found) if not ok]
             return None, {'error': f'Missing marker IDs: {missing_ids}'}
         
-        # Sort corners by marker ID
-        marker_corners = {}
-        for i, marker_id in enumerate(detected_ids):
-            if marker_id in MARKER_IDS:
-                marker_corners[marker_id] = corners[i][0]
+        # Gather the corners of the required markers in MARKER_IDS order
+        order = len(detected_ids) - 1 - matches.argmax(axis=1)
+        marker_corners = np.concatenate(corners)[order]
         
         return marker_corners, {'detected_ids': detected_ids.tolist()}
     
-    def order_corners(self, marker_corners: Dict) -> np.ndarray:
+    def order_corners(self, marker_corners: np.ndarray) -> np.ndarray:
         """
         Order the ColorChecker corners from marker positions.
         Markers are: 0=TL, 1=TR, 2=BR, 3=BL (around the ColorChecker)
         
         Args:
-            marker_corners: Dictionary mapping marker ID to corner coordinates
+            marker_corners: (4, 4, 2) marker corners in MARKER_IDS order
             
         Returns:
             Array of 4 corners in order [TL, TR, BR, BL]
         """
-        # Get the center of each marker
-        corners = []
-        for marker_id in MARKER_IDS:
-            marker = marker_corners[marker_id]
-            center = marker.mean(axis=0)
-            corners.append(center)
-        
-        return np.array(corners, dtype=np.float32)
+        # Center of each marker
+        return marker_corners.mean(axis=1).astype(np.float32)
     
     def get_colorchecker_corners(self, marker_corners_2d: np.ndarray) -> np.ndarray:
         """
@@ -128,15 +170,11 @@ class ColorCheckerDetector:
         # Calculate vectors from markers towards the center
         center = marker_corners_2d.mean(axis=0)
         
-        cc_corners = []
-        for marker_pt in marker_corners_2d:
-            direction = center - marker_pt
-            direction = direction / np.linalg.norm(direction)
-            # Move inward by approximately 15-20% of the distance to center
-            offset = direction * np.linalg.norm(center - marker_pt) * 0.3
-            cc_corners.append(marker_pt + offset)
+        # Move every marker inward by 30% of its distance to the center
+        # (unit direction times distance is just the difference vector)
+        cc_corners = marker_corners_2d + 0.3 * (center - marker_corners_2d)
         
-        return np.array(cc_corners, dtype=np.float32)
+        return cc_corners.astype(np.float32)
     
     def detect_colorchecker_type(self, image: np.ndarray, cc_corners: np.ndarray) -> str:
         """
@@ -149,29 +187,34 @@ class ColorCheckerDetector:
         Returns:
             'classic' or 'digitalsg'
         """
-        # Calculate aspect ratio
-        width = np.linalg.norm(cc_corners[1] - cc_corners[0])
-        height = np.linalg.norm(cc_corners[3] - cc_corners[0])
-        aspect_ratio = width / height
+        # Compare squared edge lengths: width / height > 1.2 <=> width² > 1.44 * height²
+        top = cc_corners[1] - cc_corners[0]
+        left = cc_corners[3] - cc_corners[0]
         
         # Classic: ~1.54 (215.9/139.7), Digital SG: ~0.77 (215.9/279.4)
-        if aspect_ratio > 1.2:
+        if top @ top > 1.44 * (left @ left):
             return 'classic'
         else:
             return 'digitalsg'
     
     def extract_patches(self, image: np.ndarray, cc_corners: np.ndarray, 
-                       cc_type: str) -> Tuple[List[np.ndarray], np.ndarray]:
+                       cc_type: str, return_warped: bool = True
+                       ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
         """
         Extract color patches from the ColorChecker.
         
+        Only the pixels inside the patch sampling windows are resampled from the
+        input image; the full warped chart is rendered only when requested.
+        
         Args:
             image: Input image
             cc_corners: ColorChecker corners [TL, TR, BR, BL]
             cc_type: 'classic' or 'digitalsg'
+            return_warped: Whether to also render the full warped ColorChecker image
             
         Returns:
-            Tuple of (list of RGB values, warped ColorChecker image)
+            Tuple of ((N, C) array of patch colors in row-major order,
+            warped ColorChecker image or None)
         """
         layout = COLORCHECKER_LAYOUTS[cc_type]
         rows, cols = layout['rows'], layout['cols']
@@ -191,12 +234,7 @@ class ColorCheckerDetector:
         # Calculate perspective transform
         matrix = cv2.getPerspectiveTransform(cc_corners, dst_corners)
         
-        # Warp the image
-        warped = cv2.warpPerspective(image, matrix, (output_width, output_height))
-        
         # Calculate patch positions
-        patch_colors = []
-        
         # Add small margin to avoid edge effects
         margin_ratio = 0.05
         effective_width = output_width * (1 - 2 * margin_ratio)
@@ -209,45 +247,57 @@ class ColorCheckerDetector:
         
         # Sample from the center of each patch (avoid edges)
         sample_ratio = 0.4  # Sample from center 40% of each patch
+        sample_w = patch_width * sample_ratio
+        sample_h = patch_height * sample_ratio
+        
+        # Patch centers and sampling bounds for every column and row
+        cx = x_start + (np.arange(cols) + 0.5) * patch_width
+        cy = y_start + (np.arange(rows) + 0.5) * patch_height
+        xs, x_offsets = _window_indices((cx - sample_w / 2).astype(np.intp),
+                                        (cx + sample_w / 2).astype(np.intp))
+        ys, y_offsets = _window_indices((cy - sample_h / 2).astype(np.intp),
+                                        (cy + sample_h / 2).astype(np.intp))
+        
+        # The sampled pixels of the warped chart form a (ys x xs) grid: map it back
+        # to the input image and resample only those pixels, as warpPerspective would
+        grid = np.stack(np.meshgrid(xs, ys), axis=-1).astype(np.float64)
+        src = cv2.perspectiveTransform(grid.reshape(-1, 1, 2), np.linalg.inv(matrix))
+        src = src.reshape(len(ys), len(xs), 2).astype(np.float32)
+        samples = cv2.remap(image, src[..., 0], src[..., 1], cv2.INTER_LINEAR)
+        samples = samples.reshape(samples.shape[0], samples.shape[1], -1)
+        
+        # Sum each window with one reduction per axis
+        sums = np.add.reduceat(samples, y_offsets, axis=0, dtype=np.float64)
+        sums = np.add.reduceat(sums, x_offsets, axis=1)
+        areas = (np.diff(y_offsets, append=len(ys))[:, None] *
+                 np.diff(x_offsets, append=len(xs)))[..., None]
+        
+        # Mean color of each patch, in row-major order
+        patch_colors = (sums / areas).reshape(rows * cols, -1)
+        if image.ndim == 2:
+            patch_colors = patch_colors[:, 0]
         
-        for row in range(rows):
-            for col in range(cols):
-                # Calculate patch center
-                cx = x_start + (col + 0.5) * patch_width
-                cy = y_start + (row + 0.5) * patch_height
-                
-                # Define sampling region
-                sample_w = patch_width * sample_ratio
-                sample_h = patch_height * sample_ratio
-                
-                x1 = int(cx - sample_w / 2)
-                x2 = int(cx + sample_w / 2)
-                y1 = int(cy - sample_h / 2)
-                y2 = int(cy + sample_h / 2)
-                
-                # Extract patch region
-                patch = warped[y1:y2, x1:x2]
-                
-                # Calculate mean color
-                mean_color = patch.mean(axis=(0, 1))
-                patch_colors.append(mean_color)
+        # Warp the image
+        warped = None
+        if return_warped:
+            warped = cv2.warpPerspective(image, matrix, (output_width, output_height))
         
         return patch_colors, warped
     
-    def apply_light_compensation(self, patch_colors: List[np.ndarray], 
-                                 cc_type: str) -> List[np.ndarray]:
+    def apply_light_compensation(self, patch_colors: np.ndarray, 
+                                 cc_type: str) -> np.ndarray:
         """
         Apply light compensation using gray patches (only for Digital SG).
         
         Args:
-            patch_colors: List of RGB values for each patch
+            patch_colors: (N, C) array of RGB values for each patch
             cc_type: ColorChecker type
             
         Returns:
-            List of compensated RGB values
+            (N, C) array of compensated RGB values
         """
         if cc_type != 'digitalsg':
-            print("Warning: Light compensation only available for Digital SG")
+            logger.warning("Light compensation only available for Digital SG")
             return patch_colors
         
         layout = COLORCHECKER_LAYOUTS[cc_type]
@@ -257,38 +307,37 @@ class ColorCheckerDetector:
         center_indices = layout.get('center_gray_patches', [])
         
         if not peripheral_indices or not center_indices:
-            print("Warning: Gray patch positions not defined for light compensation")
+            logger.warning("Gray patch positions not defined for light compensation")
             return patch_colors
         
-        # Calculate average illumination from peripheral and center gray patches
-        peripheral_grays = [patch_colors[i] for i in peripheral_indices if i < len(patch_colors)]
-        center_grays = [patch_colors[i] for i in center_indices if i < len(patch_colors)]
+        # Every step below is a whole-array operation on the (N, C) colors
+        colors = np.asarray(patch_colors)
+        peripheral_indices = np.asarray(peripheral_indices)
+        center_indices = np.asarray(center_indices)
+        peripheral_indices = peripheral_indices[peripheral_indices < len(colors)]
+        center_indices = center_indices[center_indices < len(colors)]
         
-        if not peripheral_grays or not center_grays:
-            print("Warning: Could not find gray patches for compensation")
+        if not peripheral_indices.size or not center_indices.size:
+            logger.warning("Could not find gray patches for compensation")
             return patch_colors
         
-        peripheral_avg = np.mean(peripheral_grays, axis=0)
-        center_avg = np.mean(center_grays, axis=0)
+        # Calculate average illumination from peripheral and center gray patches
+        peripheral_avg = colors[peripheral_indices].mean(axis=0)
+        center_avg = colors[center_indices].mean(axis=0)
         
         # Calculate compensation factor
         # Assume center should match peripheral illumination
         compensation = center_avg / (peripheral_avg + 1e-6)
         
-        print(f"Light compensation factors (RGB): {compensation}")
+        logger.info("Light compensation factors (RGB): %s", compensation)
         
-        # Apply compensation to all patches
-        compensated = []
-        for color in patch_colors:
-            compensated_color = color / compensation
-            # Clip to valid range
-            compensated_color = np.clip(compensated_color, 0, 255 if color.dtype == np.uint8 else 65535)
-            compensated.append(compensated_color)
+        # Apply compensation to all patches and clip to valid range
+        compensated = np.clip(colors / compensation, 0, 255 if colors.dtype == np.uint8 else 65535)
         
         return compensated
     
     def process_image(self, image_path: str, output_dir: str, 
-                     apply_light_comp: bool = False) -> Dict:
+                     apply_light_comp: bool = False, png_compress_level: int = 1) -> Dict:
         """
         Process an image to detect and extract ColorChecker data.
         
@@ -296,6 +345,7 @@ class ColorCheckerDetector:
             image_path: Path to input image
             output_dir: Directory to save outputs
             apply_light_comp: Whether to apply light compensation
+            png_compress_level: zlib level (0-9) for the saved PNG images
             
         Returns:
             Dictionary with results
@@ -314,13 +364,13 @@ class ColorCheckerDetector:
             image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
         
         # Detect ArUco markers
-        print("Detecting ArUco markers...")
+        logger.info("Detecting ArUco markers...")
         marker_corners, marker_info = self.detect_markers(image)
         
         if marker_corners is None:
             return {'error': marker_info.get('error', 'Marker detection failed')}
         
-        print(f"Found markers: {marker_info['detected_ids']}")
+        logger.info("Found markers: %s", marker_info['detected_ids'])
         
         # Order corners
         ordered_markers = self.order_corners(marker_corners)
@@ -331,15 +381,15 @@ class ColorCheckerDetector:
         # Detect ColorChecker type
         cc_type = self.detect_colorchecker_type(image, cc_corners)
         layout = COLORCHECKER_LAYOUTS[cc_type]
-        print(f"Detected ColorChecker type: {layout['name']}")
+        logger.info("Detected ColorChecker type: %s", layout['name'])
         
         # Extract patches
-        print("Extracting color patches...")
+        logger.info("Extracting color patches...")
         patch_colors, warped_image = self.extract_patches(image, cc_corners, cc_type)
         
         # Apply light compensation if requested
         if apply_light_comp and cc_type == 'digitalsg':
-            print("Applying light compensation...")
+            logger.info("Applying light compensation...")
             patch_colors_compensated = self.apply_light_compensation(patch_colors, cc_type)
         else:
             patch_colors_compensated = None
@@ -350,29 +400,30 @@ class ColorCheckerDetector:
         
         # Save warped ColorChecker image
         warped_path = output_path / 'colorchecker_extracted.png'
-        if is_16bit:
-            cv2.imwrite(str(warped_path), warped_image.astype(np.uint16))
-        else:
-            cv2.imwrite(str(warped_path), warped_image)
-        print(f"Saved extracted ColorChecker: {warped_path}")
+        # warpPerspective keeps the input depth, so 16-bit charts are already uint16
+        _write_png(warped_path, warped_image, png_compress_level)
+        logger.info("Saved extracted ColorChecker: %s", warped_path)
         
         # Save visualization with detected markers
-        vis_image = image.copy()
+        # 16-bit inputs are reduced to their high byte (integer shift, no float temporary).
+        # 8-bit inputs are drawn on in place: the loaded image is not used afterwards.
         if is_16bit:
-            vis_image = (vis_image / 256).astype(np.uint8)
+            vis_image = (image >> 8).astype(np.uint8)
+        else:
+            vis_image = image
         
         # Draw markers
         cv2.aruco.drawDetectedMarkers(vis_image, 
-                                     [marker_corners[mid].reshape(1, 4, 2) for mid in MARKER_IDS],
-                                     np.array(MARKER_IDS))
+                                     tuple(marker_corners[:, None]),
+                                     _MARKER_ID_COLUMN)
         
         # Draw ColorChecker corners
         cc_corners_int = cc_corners.astype(np.int32)
         cv2.polylines(vis_image, [cc_corners_int], True, (0, 255, 0), 3)
         
         vis_path = output_path / 'detection_visualization.png'
-        cv2.imwrite(str(vis_path), vis_image)
-        print(f"Saved visualization: {vis_path}")
+        _write_png(vis_path, vis_image, png_compress_level)
+        logger.info("Saved visualization: %s", vis_path)
         
         # Prepare JSON output
         json_data = {
@@ -384,17 +435,17 @@ class ColorCheckerDetector:
                 'total_patches': layout['total_patches']
             },
             'bit_depth': bit_depth,
-            'patch_colors': [color.tolist() for color in patch_colors],
+            'patch_colors': patch_colors.tolist(),
         }
         
-        if patch_colors_compensated:
-            json_data['patch_colors_compensated'] = [color.tolist() for color in patch_colors_compensated]
+        if patch_colors_compensated is not None:
+            json_data['patch_colors_compensated'] = patch_colors_compensated.tolist()
         
         # Save JSON
         json_path = output_path / 'colorchecker_data.json'
         with open(json_path, 'w') as f:
             json.dump(json_data, f, indent=2)
-        print(f"Saved color data: {json_path}")
+        logger.info("Saved color data: %s", json_path)
         
         return {
             'success': True,
@@ -406,6 +457,44 @@ class ColorCheckerDetector:
                 'data': str(json_path)
             }
         }
+    
+    def process_images(self, image_paths: List[str], output_dir: str,
+                       apply_light_comp: bool = False, png_compress_level: int = 1,
+                       workers: Optional[int] = None) -> List[Dict]:
+        """
+        Process several images concurrently on a thread pool.
+        
+        OpenCV releases the GIL in its heavy calls, so threads scale with cores.
+        Each worker thread gets its own ArucoDetector and grayscale buffer; the
+        dictionary and detector parameters are shared.
+        
+        Args:
+            image_paths: Paths to input images
+            output_dir: Directory to save outputs; each image gets a subdirectory
+                        named <index>_<file stem> (e.g. 0003_chart), so inputs
+                        sharing a stem do not collide
+            apply_light_comp: Whether to apply light compensation
+            png_compress_level: zlib level (0-9) for the saved PNG images
+            workers: Number of worker threads (default: os.cpu_count())
+            
+        Returns:
+            List of result dictionaries, in the order of image_paths
+        """
+        local = threading.local()
+        
+        def process(indexed_path) -> Dict:
+            i, image_path = indexed_path
+            detector = getattr(local, 'detector', None)
+            if detector is None:
+                detector = ColorCheckerDetector(self.camera_params)
+                detector.detector = cv2.aruco.ArucoDetector(self.aruco_dict, self.aruco_params)
+                local.detector = detector
+            image_output_dir = Path(output_dir) / f"{i:04d}_{Path(image_path).stem}"
+            return detector.process_image(image_path, str(image_output_dir),
+                                          apply_light_comp, png_compress_level)
+        
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            return list(pool.map(process, enumerate(image_paths)))
 
 
 def load_camera_params(params_path: str) -> Dict:
@@ -420,46 +509,9 @@ def load_camera_params(params_path: str) -> Dict:
 
 
 def main():
-    import argparse
-    
-    parser = argparse.ArgumentParser(
-        description='Detect ColorChecker and extract patch colors using ArUco markers')
-    parser.add_argument('--input', '-i', required=True,
-                       help='Input image path (8-bit or 16-bit RGB)')
-    parser.add_argument('--output', '-o', required=True,
-                       help='Output directory for results')
-    parser.add_argument('--camera-params', '-c',
-                       help='Optional: Camera intrinsic parameters (JSON file)')
-    parser.add_argument('--light-compensation', '-l', action='store_true',
-                       help='Apply light compensation (Digital SG only)')
-    
-    args = parser.parse_args()
-    
-    # Load camera parameters if provided
-    camera_params = None
-    if args.camera_params:
-        try:
-            camera_params = load_camera_params(args.camera_params)
-            print("Loaded camera parameters")
-        except Exception as e:
-            print(f"Warning: Could not load camera parameters: {e}")
-    
-    # Create detector
-    detector = ColorCheckerDetector(camera_params)
-    
-    # Process image
-    result = detector.process_image(args.input, args.output, args.light_compensation)
-    
-    if 'error' in result:
-        print(f"Error: {result['error']}")
-        return 1
-    
-    print("\nProcessing complete!")
-    print(f"ColorChecker type: {result['colorchecker_type']}")
-    print(f"Total patches: {result['total_patches']}")
-    print(f"Output files saved to: {args.output}")
-    
-    return 0
+    """Run the xrite-detect command line tool"""
+    from xRite.cli.detect import main as cli_main
+    return cli_main()
 
 
 if __name__ == '__main__':
@@ -5,13 +5,13 @@ This module generates an A3 PDF template with ArUco markers positioned at the co
 to facilitate automatic detection of ColorChecker charts (Classic 24-patch or Digital SG).
 """
 
+import functools
+
 import cv2
 import numpy as np
 from reportlab.lib.pagesizes import A3
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
-from io import BytesIO
 
 
 # ColorChecker dimensions (in mm)
@@ -39,11 +39,18 @@ ARUCO_DICT = cv2.aruco.DICT_4X4_100
 MARKER_SIZE_MM = 20  # Size of each ArUco marker in mm
 MARKER_IDS = [0, 1, 2, 3]  # IDs for the four corner markers
 
+# Predefined dictionary, built once for all generated markers
+_ARUCO_DICTIONARY = cv2.aruco.getPredefinedDictionary(ARUCO_DICT)
+
 
+@functools.lru_cache(maxsize=None)
 def generate_aruco_marker(marker_id, marker_size_pixels=200):
     """
     Generate an ArUco marker image.
     
+    Markers are cached per (marker_id, marker_size_pixels), so the returned
+    array is shared and read-only; copy it before modifying.
+    
     Args:
         marker_id: ID of the marker to generate
         marker_size_pixels: Size of the marker in pixels
@@ -51,11 +58,43 @@ def generate_aruco_marker(marker_id, marker_size_pixels=200):
     Returns:
         numpy array containing the marker image
     """
-    aruco_dict = cv2.aruco.getPredefinedDictionary(ARUCO_DICT)
-    marker_img = cv2.aruco.generateImageMarker(aruco_dict, marker_id, marker_size_pixels)
+    marker_img = cv2.aruco.generateImageMarker(_ARUCO_DICTIONARY, marker_id, marker_size_pixels)
+    marker_img.flags.writeable = False
     return marker_img
 
 
+def draw_aruco_marker(c, marker_id, x, y, size):
+    """
+    Draw an ArUco marker on a ReportLab canvas as filled vector cells.
+    
+    Args:
+        c: ReportLab canvas
+        marker_id: ID of the marker to draw
+        x, y: Bottom-left corner of the marker (points)
+        size: Side length of the marker including its border (points)
+    """
+    # One pixel per cell: the marker bits plus a 1-cell black border
+    cells = _ARUCO_DICTIONARY.markerSize + 2
+    bits = generate_aruco_marker(marker_id, marker_size_pixels=cells)
+    cell = size / cells
+    
+    c.saveState()
+    c.setFillColorRGB(0, 0, 0)
+    for i, row in enumerate(bits):
+        # Merge horizontal runs of black cells into single rectangles
+        row_y = y + (cells - 1 - i) * cell
+        j = 0
+        while j < cells:
+            if row[j]:
+                j += 1
+                continue
+            start = j
+            while j < cells and not row[j]:
+                j += 1
+            c.rect(x + start * cell, row_y, (j - start) * cell, cell, fill=1, stroke=0)
+    c.restoreState()
+
+
 def create_pdf_template(colorchecker_type, output_path):
     """
     Create a PDF template with ArUco markers for ColorChecker detection.
@@ -135,21 +174,8 @@ def create_pdf_template(colorchecker_type, output_path):
     c.setLineWidth(1)
     
     for marker_id, (mx, my) in zip(MARKER_IDS, marker_positions):
-        # Generate ArUco marker
-        marker_img = generate_aruco_marker(marker_id, marker_size_pixels=400)
-        
-        # Convert to PIL Image via BytesIO
-        marker_pil = BytesIO()
-        # Convert to RGB (cv2 generates grayscale)
-        marker_rgb = cv2.cvtColor(marker_img, cv2.COLOR_GRAY2RGB)
-        from PIL import Image
-        pil_img = Image.fromarray(marker_rgb)
-        pil_img.save(marker_pil, format='PNG')
-        marker_pil.seek(0)
-        
-        # Draw marker on PDF
-        c.drawImage(ImageReader(marker_pil), mx, my, 
-                   width=marker_size, height=marker_size)
+        # Draw ArUco marker as vector cells
+        draw_aruco_marker(c, marker_id, mx, my, marker_size)
         
         # Add marker ID label
         c.setFont("Helvetica", 8)
@@ -186,21 +212,9 @@ def create_pdf_template(colorchecker_type, output_path):
 
 
 def main():
-    import argparse
-    
-    parser = argparse.ArgumentParser(
-        description='Generate ColorChecker detection template with ArUco markers')
-    parser.add_argument('--type', '-t', 
-                       choices=['classic', 'digitalsg'],
-                       default='classic',
-                       help='Type of ColorChecker (classic or digitalsg)')
-    parser.add_argument('--output', '-o',
-                       default='colorchecker_template.pdf',
-                       help='Output PDF file path')
-    
-    args = parser.parse_args()
-    
-    create_pdf_template(args.type, args.output)
+    """Run the xrite-template command line tool"""
+    from xRite.cli.template import main as cli_main
+    return cli_main()
 
 
 if __name__ == '__main__':
@@ -5,11 +5,13 @@ Uses numpy for data structures
 """
 
 import ctypes
+import functools
 from ctypes import c_char_p, c_void_p, c_uint32, c_int32, c_float, POINTER, byref
 from enum import IntEnum, IntFlag
 import numpy as np
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict
 import os
+import time
 
 
 # Type definitions matching i1Pro.h
@@ -110,37 +112,99 @@ SPECTRUM_SIZE = 36  # 380-730nm in 10nm steps
 TRISTIMULUS_SIZE = 3  # X, Y, Z or x, y, Y
 DENSITY_SIZE = 4  # C, M, Y, K
 
-# Measurement mode strings for SDK
-_MEASUREMENT_MODE_STRINGS = {
-    MeasurementMode.EMISSION_SPOT: b"EmissionSpot",
-    MeasurementMode.REFLECTANCE_SPOT: b"ReflectanceSpot",
-    MeasurementMode.DUAL_REFLECTANCE_SPOT: b"DualReflectanceSpot",
-    MeasurementMode.REFLECTANCE_SCAN: b"ReflectanceScan",
-    MeasurementMode.DUAL_REFLECTANCE_SCAN: b"DualReflectanceScan",
-    MeasurementMode.AMBIENT_LIGHT_SPOT: b"AmbientLightSpot",
-    MeasurementMode.AMBIENT_LIGHT_SCAN: b"AmbientLightScan",
-}
-
-# Illumination strings for SDK
-_ILLUMINATION_STRINGS = {
-    Illumination.A: b"A",
-    Illumination.B: b"B",
-    Illumination.C: b"C",
-    Illumination.D50: b"D50",
-    Illumination.D55: b"D55",
-    Illumination.D65: b"D65",
-    Illumination.D75: b"D75",
-    Illumination.F2: b"F2",
-    Illumination.F7: b"F7",
-    Illumination.F11: b"F11",
-    Illumination.EMISSION: b"Emission",
-}
-
-# Observer strings for SDK
-_OBSERVER_STRINGS = {
-    Observer.TWO_DEGREE: b"TwoDegree",
-    Observer.TEN_DEGREE: b"TenDegree",
-}
+# Argument types for the float buffers filled by the SDK
+_SPECTRUM_ARG = np.ctypeslib.ndpointer(dtype=np.float32, shape=(SPECTRUM_SIZE,),
+                                       flags='C_CONTIGUOUS,WRITEABLE,ALIGNED')
+_TRISTIMULUS_ARG = np.ctypeslib.ndpointer(dtype=np.float32, shape=(TRISTIMULUS_SIZE,),
+                                          flags='C_CONTIGUOUS,WRITEABLE,ALIGNED')
+
+# Wavelength axis shared by every spectrum (read-only)
+WAVELENGTHS = np.arange(380, 731, 10, dtype=np.float32)
+WAVELENGTHS.setflags(write=False)
+
+# Prebuilt sample-index arguments, reused instead of constructing a c_int32 per call
+_I1_INT_CACHE = tuple(I1_Integer(i) for i in range(64))
+
+
+def _index_arg(index: int) -> I1_Integer:
+    """Return a c_int32 sample index, reusing a cached object for small indices"""
+    if 0 <= index < 64:
+        return _I1_INT_CACHE[index]
+    return I1_Integer(index)
+
+
+# Option names for SetOption/GetOption/GetGlobalOption
+_OPT_MEASUREMENT_MODE = b"MeasurementMode"
+_OPT_ILLUMINATION = b"Colorimetric.Illumination"
+_OPT_OBSERVER = b"Colorimetric.Observer"
+_OPT_COLOR_SPACE = b"ColorSpaceDescription.Type"
+_OPT_SERIAL_NUMBER = b"SerialNumber"
+_OPT_SDK_VERSION = b"SDKVersion"
+_OPT_LAST_ERROR_TEXT = b"LastErrorText"
+
+# Color space used for tristimulus values
+_COLOR_SPACE_XYY = b"CIExyY"
+
+# Measurement mode strings for SDK, indexed by MeasurementMode value
+_MEASUREMENT_MODE_STRINGS = (
+    b"EmissionSpot",
+    b"ReflectanceSpot",
+    b"DualReflectanceSpot",
+    b"ReflectanceScan",
+    b"DualReflectanceScan",
+    b"AmbientLightSpot",
+    b"AmbientLightScan",
+)
+
+# Modes in which the SDK reports the spectrum as a 0-1 fraction
+_REFLECTANCE_MODES = frozenset({
+    MeasurementMode.REFLECTANCE_SPOT,
+    MeasurementMode.REFLECTANCE_SCAN,
+    MeasurementMode.DUAL_REFLECTANCE_SPOT,
+    MeasurementMode.DUAL_REFLECTANCE_SCAN,
+})
+
+# Illumination strings for SDK, indexed by Illumination value
+_ILLUMINATION_STRINGS = (
+    b"A",
+    b"B",
+    b"C",
+    b"D50",
+    b"D55",
+    b"D65",
+    b"D75",
+    b"F2",
+    b"F7",
+    b"F11",
+    b"Emission",
+)
+
+# Observer strings for SDK, indexed by Observer value
+_OBSERVER_STRINGS = (
+    b"TwoDegree",
+    b"TenDegree",
+)
+
+
+# Pointer width of this interpreter; the vendor DLLs are architecture-specific
+_IS_32BIT = ctypes.sizeof(c_void_p) == 4
+
+# Package root (two levels up: src/xRite -> xRite project root)
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# DLL search order, resolved once for this architecture
+if _IS_32BIT:
+    # i1Profiler installation paths (known working 32-bit DLLs)
+    _DLL_CANDIDATES = (
+        r"C:\Program Files (x86)\X-Rite\Devices\i1pro3\i1Pro3.dll",
+        r"C:\Program Files (x86)\X-Rite\Devices\i1pro\i1Pro.dll",
+        r"C:\Program Files\X-Rite\Devices\i1pro3\i1Pro3.dll",
+        r"C:\Program Files\X-Rite\Devices\i1pro\i1Pro.dll",
+    )
+else:
+    _DLL_CANDIDATES = (
+        os.path.join(_PACKAGE_ROOT, "dlls", "i1Pro64.dll"),
+    )
 
 
 def _test_dll_for_device(dll_path: str) -> bool:
@@ -184,6 +248,12 @@ def _test_dll_for_device(dll_path: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _existing_dll_candidates() -> Tuple[str, ...]:
+    """DLL candidates present on disk, in search order (the install layout is stable per process)"""
+    return tuple(p for p in _DLL_CANDIDATES if os.path.exists(p))
+
+
 def get_default_dll_path() -> str:
     """
     Get the default path to the i1Pro DLL.
@@ -199,40 +269,20 @@ def get_default_dll_path() -> str:
     Returns:
         Path to the DLL file that works with connected device
     """
-    import struct
-    is_32bit = struct.calcsize("P") * 8 == 32
-    
-    # Get the directory containing this module
-    module_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Get the package root (two levels up: src/xRite -> xRite project root)
-    package_root = os.path.dirname(os.path.dirname(module_dir))
-    
-    # For 32-bit Python, prefer the i1Profiler installation (known working DLL)
-    if is_32bit:
-        # Check i1Profiler installation paths - test each to find working one
-        i1profiler_paths = [
-            r"C:\Program Files (x86)\X-Rite\Devices\i1pro3\i1Pro3.dll",
-            r"C:\Program Files (x86)\X-Rite\Devices\i1pro\i1Pro.dll",
-            r"C:\Program Files\X-Rite\Devices\i1pro3\i1Pro3.dll",
-            r"C:\Program Files\X-Rite\Devices\i1pro\i1Pro.dll",
-        ]
-        
-        # First pass: test each DLL to see which one detects a device
-        for dll_path in i1profiler_paths:
-            if os.path.exists(dll_path) and _test_dll_for_device(dll_path):
-                return dll_path
-        
-        # Second pass: if no device detected, return first existing DLL
-        # (might be used for other operations even without device)
-        for dll_path in i1profiler_paths:
-            if os.path.exists(dll_path):
+    # Only the file lookup is cached; the device probe runs on every call so a
+    # device attached later is still found
+    existing = _existing_dll_candidates()
+    
+    # For 32-bit Python, prefer the i1Profiler DLL that detects a device
+    if _IS_32BIT:
+        for dll_path in existing:
+            if _test_dll_for_device(dll_path):
                 return dll_path
     
-    else:
-        dll_path = os.path.join(package_root, "dlls", "i1Pro64.dll")
-        if os.path.exists(dll_path):
-            return dll_path
+    # Otherwise return first existing DLL
+    # (might be used for other operations even without device)
+    if existing:
+        return existing[0]
 
 class I1ProException(Exception):
     """Exception for i1Pro SDK errors"""
@@ -242,6 +292,16 @@ class I1ProException(Exception):
         super().__init__(f"i1Pro Error {result_code}: {message}")
 
 
+# SDK entry points used by the wrapper (without the I1_/I1PRO3_ prefix)
+_SDK_FUNCTION_NAMES = (
+    'GetDevices', 'OpenDevice', 'CloseDevice',
+    'SetGlobalOption', 'GetGlobalOption', 'SetOption', 'GetOption',
+    'GetConnectionStatus', 'GetButtonStatusD', 'Calibrate', 'TriggerMeasurement',
+    'GetNumberOfAvailableSamples', 'GetSpectrum', 'GetTriStimulus',
+    'GetDensities', 'GetDensity',
+)
+
+
 class I1ProSDK:
     """Low-level wrapper for i1Pro SDK DLL - supports i1Pro/i1Pro2 and i1Pro3"""
     
@@ -259,6 +319,9 @@ class I1ProSDK:
         if not os.path.exists(dll_path):
             raise FileNotFoundError(f"i1Pro DLL not found at: {dll_path}")
         
+        # CDLL (unlike PyDLL) releases the GIL for the duration of every call,
+        # so blocking calls such as Calibrate and TriggerMeasurement do not
+        # stall other Python threads
         self.dll = ctypes.CDLL(dll_path)
         self.dll_path = dll_path
         
@@ -276,9 +339,12 @@ class I1ProSDK:
     def _setup_functions(self):
         """Setup function signatures for all SDK functions using dynamic prefix"""
         
-        # Helper to get function with correct prefix
-        def get_func(name):
-            return getattr(self.dll, f'{self.prefix}{name}')
+        # Resolve every entry point once; callers look them up by unprefixed name
+        self.functions = {
+            name: getattr(self.dll, f'{self.prefix}{name}')
+            for name in _SDK_FUNCTION_NAMES
+        }
+        get_func = self.functions.__getitem__
         
         # GetDevices
         # Signature: I1_GetDevices(I1_DeviceHandle **devices, I1_UInteger *count)
@@ -335,9 +401,11 @@ class I1ProSDK:
         get_func('GetNumberOfAvailableSamples').restype = I1_Integer
         
         # GetSpectrum
+        # Buffers are passed as numpy arrays; ndpointer checks dtype, shape
+        # and layout and hands the data pointer straight to the SDK
         get_func('GetSpectrum').argtypes = [
             I1_DeviceHandle,
-            POINTER(c_float * SPECTRUM_SIZE),
+            _SPECTRUM_ARG,
             I1_Integer
         ]
         get_func('GetSpectrum').restype = I1_ResultType
@@ -345,7 +413,7 @@ class I1ProSDK:
         # GetTriStimulus
         get_func('GetTriStimulus').argtypes = [
             I1_DeviceHandle,
-            POINTER(c_float * TRISTIMULUS_SIZE),
+            _TRISTIMULUS_ARG,
             I1_Integer
         ]
         get_func('GetTriStimulus').restype = I1_ResultType
@@ -368,9 +436,32 @@ class I1ProSDK:
         get_func('GetDensity').restype = I1_ResultType
 
 
+# Loaded SDKs by DLL path, shared by all I1Pro instances
+_SDK_CACHE: Dict[str, I1ProSDK] = {}
+
+
+def _get_sdk(dll_path: Optional[str] = None) -> I1ProSDK:
+    """Return the I1ProSDK for a DLL, loading and setting it up on first use"""
+    if dll_path is None:
+        dll_path = get_default_dll_path()
+    sdk = _SDK_CACHE.get(dll_path)
+    if sdk is None:
+        sdk = _SDK_CACHE[dll_path] = I1ProSDK(dll_path)
+    return sdk
+
+
 class I1Pro:
     """High-level Python wrapper for i1Pro colorimeter"""
     
+    # Fixed attribute layout keeps attribute access cheap in measurement loops
+    __slots__ = (
+        'sdk', 'device_handle', 'is_open', 'is_calibrated', 'measurement_mode',
+        '_is_reflectance', '_last_opts', '_serial', '_sdk_version',
+        '_error_buf',
+        '_trigger_func', '_get_spectrum_func', '_get_tristimulus_func',
+        '_button_status_func',
+    )
+    
     def __init__(self, dll_path: Optional[str] = None):
         """
         Initialize i1Pro device
@@ -378,15 +469,27 @@ class I1Pro:
         Args:
             dll_path: Optional path to i1Pro DLL
         """
-        self.sdk = I1ProSDK(dll_path)
+        self.sdk = _get_sdk(dll_path)
         self.device_handle: Optional[I1_DeviceHandle] = None
         self.is_open = False
         self.is_calibrated = False
         self.measurement_mode: Optional[MeasurementMode] = None
+        self._is_reflectance = False
+        self._last_opts: Dict[bytes, bytes] = {}
+        self._serial: Optional[str] = None
+        self._sdk_version: Optional[str] = None
+        
+        self._error_buf = ctypes.create_string_buffer(256)
+        
+        # Bind the functions called per sample / per poll once
+        self._trigger_func = self._get_func('TriggerMeasurement')
+        self._get_spectrum_func = self._get_func('GetSpectrum')
+        self._get_tristimulus_func = self._get_func('GetTriStimulus')
+        self._button_status_func = self._get_func('GetButtonStatusD')
     
     def _get_func(self, name: str):
         """Helper to get SDK function with correct prefix"""
-        return getattr(self.sdk.dll, f'{self.sdk.prefix}{name}')
+        return self.sdk.functions[name]
         
     def __enter__(self):
         """Context manager entry"""
@@ -398,16 +501,20 @@ class I1Pro:
     
     def _check_result(self, result: int):
         """Check SDK result code and raise exception if error"""
-        if result != I1ResultType.eNoError:
-            error_text = self.get_last_error_text()
-            raise I1ProException(I1ResultType(result), error_text)
+        if result:
+            self._raise(result)
+    
+    def _raise(self, result: int):
+        """Raise an I1ProException for a non-zero SDK result code"""
+        error_text = self.get_last_error_text()
+        raise I1ProException(I1ResultType(result), error_text)
     
     def get_last_error_text(self) -> str:
         """Get last error description"""
-        buffer = ctypes.create_string_buffer(256)
-        size = I1_UInteger(256)
+        buffer = self._error_buf
+        size = I1_UInteger(len(buffer))
         self._get_func('GetGlobalOption')(
-            b"LastErrorText",
+            _OPT_LAST_ERROR_TEXT,
             buffer,
             byref(size)
         )
@@ -471,6 +578,7 @@ class I1Pro:
         
         self.is_open = True
         self.is_calibrated = False
+        self._last_opts.clear()
         return True
     
     def close(self):
@@ -479,6 +587,8 @@ class I1Pro:
             self._get_func('CloseDevice')(self.device_handle)
             self.is_open = False
             self.is_calibrated = False
+            self._last_opts.clear()
+            self._serial = None
             self.device_handle = None
     
     def set_measurement_mode(self, mode: MeasurementMode):
@@ -492,15 +602,12 @@ class I1Pro:
             raise I1ProException(I1ResultType.eDeviceNotOpen, 
                                "Device not open")
         
-        mode_str = _MEASUREMENT_MODE_STRINGS[mode]
-        result = self._get_func('SetOption')(
-            self.device_handle,
-            b"MeasurementMode",
-            mode_str
-        )
-        self._check_result(result)
+        # Mode change resets the option state tracked for configure()
+        self._last_opts.clear()
+        self._set_option(_OPT_MEASUREMENT_MODE, _MEASUREMENT_MODE_STRINGS[int(mode)])
         
         self.measurement_mode = mode
+        self._is_reflectance = mode in _REFLECTANCE_MODES
         self.is_calibrated = False  # Mode change invalidates calibration
     
     def set_illumination(self, illumination: Illumination):
@@ -514,13 +621,7 @@ class I1Pro:
             raise I1ProException(I1ResultType.eDeviceNotOpen,
                                "Device not open")
         
-        illum_str = _ILLUMINATION_STRINGS[illumination]
-        result = self._get_func('SetOption')(
-            self.device_handle,
-            b"Colorimetric.Illumination",
-            illum_str
-        )
-        self._check_result(result)
+        self._set_option(_OPT_ILLUMINATION, _ILLUMINATION_STRINGS[int(illumination)])
     
     def set_observer(self, observer: Observer):
         """
@@ -533,13 +634,59 @@ class I1Pro:
             raise I1ProException(I1ResultType.eDeviceNotOpen,
                                "Device not open")
         
-        obs_str = _OBSERVER_STRINGS[observer]
-        result = self._get_func('SetOption')(
-            self.device_handle,
-            b"Colorimetric.Observer",
-            obs_str
-        )
+        self._set_option(_OPT_OBSERVER, _OBSERVER_STRINGS[int(observer)])
+    
+    def configure(self, mode: Optional[MeasurementMode] = None,
+                  observer: Optional[Observer] = None,
+                  illumination: Optional[Illumination] = None,
+                  color_space: Optional[bytes] = None):
+        """
+        Apply several measurement options at once
+        
+        Options that are already set to the requested value are skipped,
+        so re-applying the same configuration costs no SDK calls. Changing
+        the mode invalidates calibration, as with set_measurement_mode.
+        
+        Args:
+            mode: Measurement mode
+            observer: Observer type (2° or 10°)
+            illumination: Illumination type
+            color_space: SDK color space name for tristimulus values (e.g. b"CIExyY")
+        """
+        if not self.is_open:
+            raise I1ProException(I1ResultType.eDeviceNotOpen,
+                               "Device not open")
+        
+        if (mode is not None and self._last_opts.get(_OPT_MEASUREMENT_MODE)
+                != _MEASUREMENT_MODE_STRINGS[int(mode)]):
+            self.set_measurement_mode(mode)
+        if illumination is not None:
+            self._set_option_cached(_OPT_ILLUMINATION, _ILLUMINATION_STRINGS[int(illumination)])
+        if observer is not None:
+            self._set_option_cached(_OPT_OBSERVER, _OBSERVER_STRINGS[int(observer)])
+        if color_space is not None:
+            self._set_option_cached(_OPT_COLOR_SPACE, color_space)
+    
+    def _set_option(self, name: bytes, value: bytes):
+        """Set a device option and remember its value"""
+        result = self._get_func('SetOption')(self.device_handle, name, value)
         self._check_result(result)
+        self._last_opts[name] = value
+    
+    def _set_option_cached(self, name: bytes, value: bytes):
+        """Set a device option unless it already has the requested value"""
+        if self._last_opts.get(name) != value:
+            self._set_option(name, value)
+    
+    def _ensure_colorspace(self, colorspace: bytes):
+        """
+        Set the color space used for tristimulus values, skipping the SDK
+        call when it is already active
+        
+        Args:
+            colorspace: SDK color space name (e.g. b"CIExyY")
+        """
+        self._set_option_cached(_OPT_COLOR_SPACE, colorspace)
     
     def calibrate(self) -> bool:
         """
@@ -566,15 +713,16 @@ class I1Pro:
         Returns:
             True if successful
         """
-        if not self.is_open:
-            raise I1ProException(I1ResultType.eDeviceNotOpen,
-                               "Device not open")
-        
+        # is_calibrated is only ever True while the device is open, so one
+        # test covers the common path; work out which error it was after
         if not self.is_calibrated:
+            if not self.is_open:
+                raise I1ProException(I1ResultType.eDeviceNotOpen,
+                                   "Device not open")
             raise I1ProException(I1ResultType.eDeviceNotCalibrated,
                                "Device not calibrated")
         
-        result = self._get_func('TriggerMeasurement')(self.device_handle)
+        result = self._trigger_func(self.device_handle)
         self._check_result(result)
         
         return True
@@ -607,30 +755,55 @@ class I1Pro:
             raise I1ProException(I1ResultType.eDeviceNotOpen,
                                "Device not open")
         
-        spectrum = (c_float * SPECTRUM_SIZE)()
-        result = self._get_func('GetSpectrum')(
+        # The SDK writes straight into the array that is returned (no copy)
+        spec_array = np.empty(SPECTRUM_SIZE, dtype=np.float32)
+        result = self._get_spectrum_func(
             self.device_handle,
-            byref(spectrum),
-            I1_Integer(index)
+            spec_array,
+            _index_arg(index)
         )
         self._check_result(result)
         
-        # Convert to numpy array and ensure no negative values
-        spec_array = np.array(spectrum, dtype=np.float32)
-        spec_array[spec_array < 0] = 0.0
+        # Ensure no negative values
+        np.maximum(spec_array, 0.0, out=spec_array)
         
         # In reflectance mode, SDK returns values as fractions (0-1)
         # but Y values as percentages (0-100). Scale spectrum to match.
-        # Check if we're in reflectance mode by testing spectrum range
-        if self.measurement_mode in [MeasurementMode.REFLECTANCE_SPOT,
-                                     MeasurementMode.REFLECTANCE_SCAN,
-                                     MeasurementMode.DUAL_REFLECTANCE_SPOT,
-                                     MeasurementMode.DUAL_REFLECTANCE_SCAN]:
+        if self._is_reflectance:
             # Scale from 0-1 to 0-100 to match Y percentage
-            spec_array = spec_array * 100.0
+            np.multiply(spec_array, 100.0, out=spec_array)
         
         return spec_array
     
+    def get_all_spectra(self) -> np.ndarray:
+        """
+        Get spectral data for every sample of the last measurement
+        
+        Intended for scan modes: each row is filled in place by the SDK and
+        clipping/scaling is applied once to the whole matrix.
+        
+        Returns:
+            numpy array of shape (samples, 36), same units as get_spectrum
+        """
+        if not self.is_open:
+            raise I1ProException(I1ResultType.eDeviceNotOpen,
+                               "Device not open")
+        
+        n = self.get_number_of_samples()
+        out = np.empty((n, SPECTRUM_SIZE), dtype=np.float32)
+        get_spectrum = self._get_spectrum_func
+        handle = self.device_handle
+        
+        for i in range(n):
+            result = get_spectrum(handle, out[i], _index_arg(i))
+            self._check_result(result)
+        
+        np.maximum(out, 0.0, out=out)
+        if self._is_reflectance:
+            out *= 100.0
+        
+        return out
+    
     def get_tristimulus(self, index: int = 0) -> np.ndarray:
         """
         Get tristimulus values from measurement (x, y, Y for xyY or X, Y, Z)
@@ -646,22 +819,17 @@ class I1Pro:
                                "Device not open")
         
         # Set color space to CIE xyY
-        result = self._get_func('SetOption')(
-            self.device_handle,
-            b"ColorSpaceDescription.Type",
-            b"CIExyY"
-        )
-        self._check_result(result)
+        self._ensure_colorspace(_COLOR_SPACE_XYY)
         
-        tristimulus = (c_float * TRISTIMULUS_SIZE)()
-        result = self._get_func('GetTriStimulus')(
+        tristimulus = np.empty(TRISTIMULUS_SIZE, dtype=np.float32)
+        result = self._get_tristimulus_func(
             self.device_handle,
-            byref(tristimulus),
-            I1_Integer(index)
+            tristimulus,
+            _index_arg(index)
         )
         self._check_result(result)
         
-        return np.array(tristimulus, dtype=np.float32)
+        return tristimulus
     
     def get_xyY(self, index: int = 0) -> Tuple[float, float, float]:
         """
@@ -676,6 +844,18 @@ class I1Pro:
         tristimulus = self.get_tristimulus(index)
         return tuple(tristimulus)
     
+    def get_xyY_array(self, index: int = 0) -> np.ndarray:
+        """
+        Get xyY color coordinates as an array
+        
+        Args:
+            index: Sample index
+            
+        Returns:
+            numpy array of [x, y, Y]
+        """
+        return self.get_tristimulus(index)
+    
     def measure_xyY(self) -> Tuple[float, float, float]:
         """
         Perform a complete measurement and return xyY
@@ -703,11 +883,61 @@ class I1Pro:
         Returns:
             Tuple of (xyY tuple, spectrum array)
         """
-        self.trigger_measurement()
-        xyY = self.get_xyY()
-        spectrum = self.get_spectrum()
+        xyY, spectrum = self.measure_xyY_and_spectrum_array()
+        return tuple(xyY), spectrum
+    
+    def measure_xyY_and_spectrum_array(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Perform a complete measurement and return both xyY and spectrum
+        as numpy arrays
+        
+        Returns:
+            Tuple of (xyY array of 3 values, spectrum array of 36 values)
+        """
+        spectrum = np.empty(SPECTRUM_SIZE, dtype=np.float32)
+        xyY = np.empty(TRISTIMULUS_SIZE, dtype=np.float32)
+        self.measure_into(spectrum, xyY)
         return xyY, spectrum
     
+    def measure_into(self, spec_out: np.ndarray, xyY_out: np.ndarray):
+        """
+        Perform a complete measurement, writing into caller-owned buffers
+        
+        The SDK fills both arrays directly, so repeated measurements need
+        no allocation.
+        
+        Args:
+            spec_out: C-contiguous float32 array of 36 values, receives the spectrum
+            xyY_out: C-contiguous float32 array of 3 values, receives x, y, Y
+        """
+        for name, arr, size in (("spec_out", spec_out, SPECTRUM_SIZE),
+                                ("xyY_out", xyY_out, TRISTIMULUS_SIZE)):
+            if (arr.dtype != np.float32 or arr.shape != (size,)
+                    or not arr.flags.c_contiguous or not arr.flags.writeable):
+                raise ValueError(f"{name} must be a writeable contiguous float32 array of {size} values")
+        
+        self.trigger_measurement()
+        self._ensure_colorspace(_COLOR_SPACE_XYY)
+        
+        index = _I1_INT_CACHE[0]
+        result = self._get_tristimulus_func(
+            self.device_handle,
+            xyY_out,
+            index
+        )
+        self._check_result(result)
+        
+        result = self._get_spectrum_func(
+            self.device_handle,
+            spec_out,
+            index
+        )
+        self._check_result(result)
+        
+        np.maximum(spec_out, 0.0, out=spec_out)
+        if self._is_reflectance:
+            np.multiply(spec_out, 100.0, out=spec_out)
+    
     def is_button_pressed(self) -> bool:
         """
         Check if device button is pressed
@@ -718,68 +948,87 @@ class I1Pro:
         if not self.is_open:
             return False
         
-        status = self._get_func('GetButtonStatusD')(self.device_handle)
+        status = self._button_status_func(self.device_handle)
         return status == I1ButtonStatusType.eButtonIsPressed
     
+    def _poll_button(self, pressed: bool):
+        """
+        Block until the button state equals `pressed`
+        
+        Polls every millisecond for the first 100 ms, then backs off
+        exponentially to at most 50 ms between polls.
+        """
+        delay = 0.001
+        fast_until = time.monotonic() + 0.1
+        while self.is_button_pressed() != pressed:
+            time.sleep(delay)
+            if time.monotonic() > fast_until:
+                delay = min(delay * 2, 0.05)
+    
     def wait_for_button(self):
         """Wait for user to press button on device"""
-        import time
         print("Press the i1Pro button...")
-        while not self.is_button_pressed():
-            time.sleep(0.1)
+        self._poll_button(True)
         # Wait for release
-        while self.is_button_pressed():
-            time.sleep(0.1)
+        self._poll_button(False)
     
     def get_wavelengths(self) -> np.ndarray:
         """
         Get wavelength array corresponding to spectrum measurements
         
         Returns:
-            numpy array of 36 wavelengths (380-730nm in 10nm steps)
+            Read-only numpy array of 36 wavelengths (380-730nm in 10nm steps)
         """
-        return np.arange(380, 731, 10, dtype=np.float32)
+        return WAVELENGTHS
     
     def get_serial_number(self) -> str:
         """
         Get device serial number
         
         Returns:
-            Serial number string
+            Serial number string (cached while the device stays open)
         """
         if not self.is_open:
             raise I1ProException(I1ResultType.eDeviceNotOpen,
                                "Device not open")
         
+        if self._serial is not None:
+            return self._serial
+        
         buffer = ctypes.create_string_buffer(256)
         size = I1_UInteger(256)
         result = self._get_func('GetOption')(
             self.device_handle,
-            b"SerialNumber",
+            _OPT_SERIAL_NUMBER,
             buffer,
             byref(size)
         )
         self._check_result(result)
         
-        return buffer.value.decode('utf-8')
+        self._serial = buffer.value.decode('utf-8')
+        return self._serial
     
     def get_sdk_version(self) -> str:
         """
         Get SDK version
         
         Returns:
-            SDK version string
+            SDK version string (cached after the first call)
         """
+        if self._sdk_version is not None:
+            return self._sdk_version
+        
         buffer = ctypes.create_string_buffer(256)
         size = I1_UInteger(256)
         result = self._get_func('GetGlobalOption')(
-            b"SDKVersion",
+            _OPT_SDK_VERSION,
             buffer,
             byref(size)
         )
         self._check_result(result)
         
-        return buffer.value.decode('utf-8')
+        self._sdk_version = buffer.value.decode('utf-8')
+        return self._sdk_version
 
 
 def main():
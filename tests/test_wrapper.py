@@ -3,13 +3,18 @@ Test script for i1Pro Python wrapper
 Run without device to test SDK loading
 """
 
+import contextlib
+import functools
+import io
 import sys
-import os
 
-# Add src directory to path for importing xRite package
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from xRite import I1Pro, MeasurementMode, Observer, Illumination, I1ProException, WAVELENGTHS
 
-from xRite import I1Pro, MeasurementMode, Observer, Illumination, I1ProException
+
+@functools.lru_cache(maxsize=1)
+def get_device():
+    """Device object shared by all tests (the SDK is loaded and bound once)"""
+    return I1Pro()
 
 
 def test_sdk_loading():
@@ -17,7 +22,7 @@ def test_sdk_loading():
     print("Test 1: SDK Loading")
     print("-" * 50)
     try:
-        device = I1Pro()
+        device = get_device()
         print("✓ SDK loaded successfully")
         print(f"✓ SDK Version: {device.get_sdk_version()}")
         return True
@@ -34,7 +39,7 @@ def test_device_detection():
     print("\nTest 2: Device Detection")
     print("-" * 50)
     try:
-        device = I1Pro()
+        device = get_device()
         num_devices = device.get_devices()
         print(f"✓ Devices found: {num_devices}")
         if num_devices == 0:
@@ -51,23 +56,21 @@ def test_enums():
     print("-" * 50)
     try:
         # Test MeasurementMode
-        modes = [
-            MeasurementMode.EMISSION_SPOT,
-            MeasurementMode.REFLECTANCE_SPOT,
-            MeasurementMode.REFLECTANCE_SCAN,
-        ]
+        modes = ("EMISSION_SPOT", "REFLECTANCE_SPOT", "REFLECTANCE_SCAN")
+        for name in modes:
+            getattr(MeasurementMode, name)
         print(f"✓ MeasurementMode enum: {len(modes)} modes tested")
         
         # Test Illumination
-        illums = [
-            Illumination.D50,
-            Illumination.D65,
-            Illumination.A,
-        ]
+        illums = ("D50", "D65", "A")
+        for name in illums:
+            getattr(Illumination, name)
         print(f"✓ Illumination enum: {len(illums)} illuminants tested")
         
         # Test Observer
-        observers = [Observer.TWO_DEGREE, Observer.TEN_DEGREE]
+        observers = ("TWO_DEGREE", "TEN_DEGREE")
+        for name in observers:
+            getattr(Observer, name)
         print(f"✓ Observer enum: {len(observers)} observers tested")
         
         return True
@@ -82,7 +85,7 @@ def test_device_operations():
     print("-" * 50)
     
     try:
-        device = I1Pro()
+        device = get_device()
         num_devices = device.get_devices()
         
         if num_devices == 0:
@@ -92,21 +95,22 @@ def test_device_operations():
         # Open device
         print("Opening device...")
         device.open()
-        print(f"✓ Device opened")
-        print(f"  Serial: {device.get_serial_number()}")
-        
-        # Set measurement mode
-        print("Setting measurement mode...")
-        device.set_measurement_mode(MeasurementMode.EMISSION_SPOT)
-        device.set_observer(Observer.TWO_DEGREE)
-        print("✓ Measurement mode set")
-        
-        # Get wavelengths
-        wavelengths = device.get_wavelengths()
-        print(f"✓ Wavelengths: {wavelengths[0]:.0f}nm to {wavelengths[-1]:.0f}nm ({len(wavelengths)} points)")
-        
-        # Close device
-        device.close()
+        try:
+            print(f"✓ Device opened")
+            print(f"  Serial: {device.get_serial_number()}")
+            
+            # Set measurement mode
+            print("Setting measurement mode...")
+            device.set_measurement_mode(MeasurementMode.EMISSION_SPOT)
+            device.set_observer(Observer.TWO_DEGREE)
+            print("✓ Measurement mode set")
+            
+            # Get wavelengths
+            wavelengths = device.get_wavelengths()
+            print(f"✓ Wavelengths: {wavelengths[0]:.0f}nm to {wavelengths[-1]:.0f}nm ({len(wavelengths)} points)")
+        finally:
+            # Close device (the instance is shared with the other tests)
+            device.close()
         print("✓ Device closed")
         
         return True
@@ -125,13 +129,15 @@ def test_numpy_integration():
     print("-" * 50)
     try:
         import numpy as np
-        device = I1Pro()
+        device = get_device()
         wavelengths = device.get_wavelengths()
         
         # Check type
         assert isinstance(wavelengths, np.ndarray), "Wavelengths should be numpy array"
         assert wavelengths.dtype == np.float32, "Should be float32"
         assert len(wavelengths) == 36, "Should have 36 values"
+        assert wavelengths is WAVELENGTHS, "Should be the shared wavelength array"
+        assert not wavelengths.flags.writeable, "Should be read-only"
         
         print("✓ NumPy arrays working correctly")
         print(f"  Shape: {wavelengths.shape}")
@@ -147,20 +153,70 @@ def test_numpy_integration():
         return False
 
 
+def test_spectrum_summary():
+    """Test spectrum_summary against NumPy on a near-flat spectrum"""
+    print("\nTest 6: Spectrum Summary")
+    print("-" * 50)
+    try:
+        import numpy as np
+        from xRite import spectrum_summary
+        
+        # White-tile-like spectrum: ~90% with a tiny spread, where a one-pass
+        # float32 variance would lose almost all of its precision
+        rng = np.random.default_rng(0)
+        spectrum = (90.0 + 0.05 * rng.standard_normal(36)).astype(np.float32)
+        
+        spec_min, spec_max, spec_mean, spec_std = spectrum_summary(spectrum)
+        
+        assert spec_min == np.min(spectrum), "Min should match np.min"
+        assert spec_max == np.max(spectrum), "Max should match np.max"
+        assert np.isclose(spec_mean, np.mean(spectrum, dtype=np.float64), rtol=1e-9), \
+            "Mean should match np.mean"
+        assert np.isclose(spec_std, np.std(spectrum, dtype=np.float64), rtol=1e-6), \
+            "Std should match np.std"
+        
+        print("✓ Spectrum summary matches NumPy")
+        print(f"  Mean: {spec_mean:.4f}%, Std: {spec_std:.6f}")
+        
+        return True
+    except AssertionError as e:
+        print(f"✗ Assertion failed: {e}")
+        return False
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        return False
+
+
+# Tests in run order, with their summary names
+TESTS = (
+    ("SDK Loading", test_sdk_loading),
+    ("Device Detection", test_device_detection),
+    ("Enum Definitions", test_enums),
+    ("Device Operations", test_device_operations),
+    ("NumPy Integration", test_numpy_integration),
+    ("Spectrum Summary", test_spectrum_summary),
+)
+
+
+def run_buffered(test):
+    """Run a test with its output collected and written to the console in one go"""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            return test()
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
 def run_all_tests():
     """Run all tests"""
     print("\n" + "=" * 50)
     print("i1Pro Python Wrapper Test Suite")
     print("=" * 50 + "\n")
     
-    results = []
-    
     # Run tests
-    results.append(("SDK Loading", test_sdk_loading()))
-    results.append(("Device Detection", test_device_detection()))
-    results.append(("Enum Definitions", test_enums()))
-    results.append(("Device Operations", test_device_operations()))
-    results.append(("NumPy Integration", test_numpy_integration()))
+    results = [(name, run_buffered(test)) for name, test in TESTS]
     
     # Summary
     print("\n" + "=" * 50)